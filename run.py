@@ -11,5 +11,6 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=settings.DEBUG,
         workers=settings.WORKERS,
+        loop="auto",  # uvloop where installed (not available on Windows)
         log_level="info"
     ) 
\ No newline at end of file
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Export the MiniLM embedding model to an int8-quantized ONNX model.
+
+The output directory can be passed to EmbeddingGenerator(onnx_dir=...).
+Requires `optimum[exporters]` in addition to the runtime requirements.
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--model",
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        help="Hugging Face model to export"
+    )
+    parser.add_argument(
+        "--output",
+        default="models/onnx_minilm",
+        help="Directory to write the ONNX model and tokenizer to"
+    )
+    args = parser.parse_args()
+    output = Path(args.output)
+    
+    print(f"Exporting {args.model} to ONNX...")
+    subprocess.run(
+        [
+            "optimum-cli", "export", "onnx",
+            "--model", args.model,
+            "--task", "feature-extraction",
+            str(output)
+        ],
+        check=True
+    )
+    
+    print("Quantizing weights to int8...")
+    quantize_dynamic(
+        str(output / "model.onnx"),
+        str(output / "model_int8.onnx"),
+        weight_type=QuantType.QInt8
+    )
+    
+    print(f"Quantized model written to {output / 'model_int8.onnx'}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,24 @@
-from fastapi import APIRouter
-from services.feedback import FeedbackTrainer
+from typing import Optional
+from fastapi import APIRouter, HTTPException, status
+from ...services.feedback.training_pipeline import FeedbackTrainer, FeedbackSample
 
 router = APIRouter()
-trainer = FeedbackTrainer()
+
+# Set by init_trainer once the model to fine-tune has been loaded
+trainer: Optional[FeedbackTrainer] = None
+
+def init_trainer(model) -> FeedbackTrainer:
+    """Create the trainer that feedback submitted to this router feeds"""
+    global trainer
+    trainer = FeedbackTrainer(model)
+    return trainer
 
 @router.post("/feedback")
 async def submit_feedback(sample: FeedbackSample):
+    if trainer is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Feedback training is not configured"
+        )
     trainer.collect_feedback(sample)
-    return {"status": "feedback received"} 
\ No newline at end of file
+    return {"status": "feedback received"}
@@ -18,11 +18,18 @@ class WorkflowRequest(BaseModel):
 
 router = APIRouter()
 
+# Shared for the app's lifetime so the engine's cached Visio service
+# outlives a single request
+engine = ExecutionEngine()
+
+@router.on_event("shutdown")
+async def close_engine():
+    await engine.close()
+
 @router.post("/execute-workflow", status_code=status.HTTP_200_OK)
 async def execute_workflow(request: WorkflowRequest):
     try:
         context = request.initial_data.copy()
-        engine = ExecutionEngine()
         
         for step in request.steps:
             try:
@@ -0,0 +1,32 @@
+"""Numba kernels for batched WCAG contrast calculations"""
+
+import numpy as np
+from numba import njit, prange
+
+@njit(inline='always')
+def _linearize(channel):
+    """Convert an 8-bit sRGB channel to linear light"""
+    c = channel / 255.0
+    if c <= 0.03928:
+        return c / 12.92
+    return ((c + 0.055) / 1.055) ** 2.4
+
+@njit(inline='always')
+def _luminance(rgb, i):
+    """WCAG relative luminance of row i of an (N, 3) RGB array"""
+    return (
+        0.2126 * _linearize(rgb[i, 0])
+        + 0.7152 * _linearize(rgb[i, 1])
+        + 0.0722 * _linearize(rgb[i, 2])
+    )
+
+@njit(parallel=True, fastmath=True, cache=True)
+def contrast_ratios(rgb_fg: np.ndarray, rgb_bg: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratios for matching rows of two (N, 3) uint8 RGB arrays"""
+    n = rgb_fg.shape[0]
+    ratios = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        fg = _luminance(rgb_fg, i)
+        bg = _luminance(rgb_bg, i)
+        ratios[i] = (max(fg, bg) + 0.05) / (min(fg, bg) + 0.05)
+    return ratios
@@ -2,10 +2,11 @@ import logging
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from pathlib import Path
-import json
+import re
 import time
 import asyncio
 from datetime import datetime
+import orjson
 
 from .ai_service_config import AIServiceManager
 from .rag_memory_service import RAGMemoryService
@@ -16,6 +17,19 @@ from ..utils.retry import with_retry
 
 logger = logging.getLogger(__name__)
 
+# Models often wrap JSON replies in a ```json fence
+_JSON_BLOCK = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+
+def _parse_json_reply(reply: str) -> Any:
+    """Parse a model reply as JSON, unwrapping a ```json fence if present"""
+    try:
+        return orjson.loads(reply)
+    except orjson.JSONDecodeError:
+        match = _JSON_BLOCK.search(reply)
+        if match is None:
+            raise
+        return orjson.loads(match.group(1))
+
 @dataclass
 class ChatbotConfig:
     """Configuration for the chatbot service"""
@@ -61,8 +75,8 @@ class ChatbotService:
         """Load system configuration from JSON file"""
         try:
             if self.config.system_config.exists():
-                with open(self.config.system_config) as f:
-                    return json.load(f)
+                with open(self.config.system_config, "rb") as f:
+                    return orjson.loads(f.read())
             else:
                 logger.warning("System config not found, using defaults")
                 return {}
@@ -103,9 +117,8 @@ class ChatbotService:
         }
         
         try:
-            with open(self.config.performance_log, "a") as f:
-                json.dump(log_entry, f)
-                f.write("\n")
+            with open(self.config.performance_log, "ab") as f:
+                f.write(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
         except Exception as e:
             logger.error(f"Error logging performance: {e}")
     
@@ -193,7 +206,7 @@ class ChatbotService:
             
             try:
                 # Parse the interpretation as JSON
-                actions = json.loads(interpretation)
+                actions = _parse_json_reply(interpretation)
                 
                 # Execute Visio actions
                 # This is where you would implement the actual Visio API calls
@@ -201,7 +214,7 @@ class ChatbotService:
                 
                 response = "Command processed successfully"
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 raise ChatbotError("Failed to parse Visio command interpretation")
             
             # Update conversation history
@@ -1,6 +1,10 @@
+import asyncio
+import contextlib
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 import aiohttp
 import aiofiles
 from datetime import datetime
@@ -16,6 +20,10 @@ logger = logging.getLogger(__name__)
 class DataEnrichmentService:
     """Service for enriching documents with external data"""
     
+    # Downloads with a Content-Length up to this size are read in one go
+    # rather than streamed
+    SMALL_DOWNLOAD_SIZE = 256 * 1024
+    
     def __init__(
         self,
         cache_service: FileCacheService,
@@ -42,6 +50,78 @@ class DataEnrichmentService:
             f"max_download_size={max_download_size}"
         )
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _url_key(url: str) -> str:
+        """Derive a stable temp-file key from a URL"""
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _preallocate(fd: int, length: int) -> None:
+        """Reserve disk extents for a download of known length
+        
+        Best effort: skipped on platforms without posix_fallocate and on
+        filesystems that reject it.
+        """
+        try:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, length)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, length, os.POSIX_FADV_SEQUENTIAL)
+        except OSError as e:
+            logger.debug(f"Could not preallocate download file: {str(e)}")
+    
+    async def _stream_to_file(self, response, f, hashers) -> int:
+        """
+        Copy a response body to an open file, updating each of hashers
+        
+        Network reads and disk writes run as separate tasks joined by a
+        small queue, so the next chunk is fetched while the previous one
+        is being written.
+        
+        Args:
+            response: aiohttp response to read from
+            f: aiofiles file opened for binary writing
+            hashers: Hash objects updated with every chunk written
+        
+        Returns:
+            Number of bytes written
+        
+        Raises:
+            ProcessingError: If the body exceeds max_download_size
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+        total_size = 0
+        
+        async def produce() -> None:
+            nonlocal total_size
+            async for chunk in response.content.iter_chunked(1 << 20):
+                total_size += len(chunk)
+                if total_size > self.max_download_size:
+                    raise ProcessingError(
+                        f"Download size exceeds limit "
+                        f"{self.max_download_size}"
+                    )
+                await queue.put(chunk)
+            await queue.put(None)
+        
+        async def consume() -> None:
+            while (chunk := await queue.get()) is not None:
+                for hasher in hashers:
+                    hasher.update(chunk)
+                await f.write(chunk)
+        
+        producer = asyncio.create_task(produce())
+        consumer = asyncio.create_task(consume())
+        try:
+            await asyncio.gather(producer, consumer)
+        finally:
+            # If either side failed, don't leave the other blocked on the queue
+            producer.cancel()
+            consumer.cancel()
+        
+        return total_size
+    
     async def download_file(
         self,
         url: str,
@@ -65,13 +145,10 @@ class DataEnrichmentService:
         """
         try:
             logger.info(f"Starting download from URL: {url}")
+            temp_path = None
             
-            # Generate temp filename from URL
-            url_hash = hashlib.sha256(url.encode()).hexdigest()
-            temp_path = self.download_dir / f"temp_{url_hash}"
-            
-            # Check cache first
-            if cached_path := await self.cache_service.get_cached_file(temp_path):
+            # Check cache first, keyed by URL so hits skip hashing entirely
+            if cached_path := await self.cache_service.get_cached_url(url):
                 logger.info(f"Found cached file for URL: {url}")
                 return {
                     "url": url,
@@ -80,14 +157,48 @@ class DataEnrichmentService:
                     "metadata": metadata or {}
                 }
             
+            # Stage the download inside the cache directory so it can be
+            # promoted with a rename once validated
+            temp_path = self.cache_service.reserve_path(self._url_key(url))
+            
+            # Revalidate an expired entry instead of re-downloading it
+            headers = {}
+            cached_metadata = self.cache_service.get_cached_metadata(url)
+            if cached_metadata:
+                if etag := cached_metadata.get("etag"):
+                    headers["If-None-Match"] = etag
+                if last_modified := cached_metadata.get("last_modified"):
+                    headers["If-Modified-Since"] = last_modified
+            
             # Download file
             async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
+                async with contextlib.AsyncExitStack() as responses:
+                    response = await responses.enter_async_context(
+                        session.get(url, headers=headers)
+                    )
+                    if response.status == 304 and cached_metadata:
+                        if cached_path := await self.cache_service.refresh_cached_url(url):
+                            logger.info(f"Cached file not modified for URL: {url}")
+                            return {
+                                "url": url,
+                                "file_path": str(cached_path),
+                                "from_cache": True,
+                                "metadata": metadata or {}
+                            }
+                        # The cached copy vanished after its metadata was
+                        # read; fetch the file unconditionally
+                        response = await responses.enter_async_context(
+                            session.get(url)
+                        )
+                    
                     if response.status != 200:
                         raise ProcessingError(
                             f"Failed to download file: HTTP {response.status}"
                         )
                     
+                    response_etag = response.headers.get("ETag")
+                    response_last_modified = response.headers.get("Last-Modified")
+                    
                     # Check content length
                     content_length = response.content_length
                     if content_length and content_length > self.max_download_size:
@@ -96,39 +207,68 @@ class DataEnrichmentService:
                             f"{self.max_download_size}"
                         )
                     
-                    # Download to temp file
+                    # Download to temp file, hashing as the bytes arrive:
+                    # SHA-256 for the result, and the cache's content ID
+                    # so the file is keyed like locally cached ones
+                    file_hash = hashlib.sha256()
+                    content_id = self.cache_service.file_validator.new_content_hasher()
                     async with aiofiles.open(temp_path, "wb") as f:
-                        total_size = 0
-                        async for chunk in response.content.iter_chunked(8192):
-                            total_size += len(chunk)
+                        if content_length:
+                            self._preallocate(f.fileno(), content_length)
+                        if (
+                            content_length
+                            and content_length <= self.SMALL_DOWNLOAD_SIZE
+                        ):
+                            # Small files: one read and one write
+                            data = await response.read()
+                            total_size = len(data)
                             if total_size > self.max_download_size:
                                 raise ProcessingError(
                                     f"Download size exceeds limit "
                                     f"{self.max_download_size}"
                                 )
-                            await f.write(chunk)
+                            file_hash.update(data)
+                            content_id.update(data)
+                            await f.write(data)
+                        else:
+                            total_size = await self._stream_to_file(
+                                response,
+                                f,
+                                (file_hash, content_id)
+                            )
+                        if content_length and total_size != content_length:
+                            # Drop any preallocated tail the body didn't fill
+                            await f.truncate(total_size)
             
             # Validate downloaded file
             validation = self.file_validator.validate_file(
                 temp_path,
-                allowed_categories=allowed_categories
+                allowed_categories=allowed_categories,
+                precomputed_hash=file_hash.hexdigest(),
+                precomputed_size=total_size,
+                precomputed_content_id=content_id.hexdigest()
             )
+            if not validation.is_valid:
+                raise ValidationError("; ".join(validation.errors))
             
-            # Cache the file
-            cached_path = await self.cache_service.cache_file(temp_path)
+            # Move the file into the cache
+            cached_path = await self.cache_service.commit_file(
+                temp_path,
+                validation,
+                source_url=url,
+                etag=response_etag,
+                last_modified=response_last_modified
+            )
             if not cached_path:
                 raise ProcessingError("Failed to cache downloaded file")
             
-            # Clean up temp file
-            temp_path.unlink()
-            
             result = {
                 "url": url,
                 "file_path": str(cached_path),
-                "size": validation["size"],
-                "mime_type": validation["mime_type"],
-                "category": validation["category"],
-                "hash": validation["hash"],
+                "size": validation.size,
+                "mime_type": validation.mime_type,
+                "category": validation.category,
+                "hash": validation.hash,
                 "from_cache": False,
                 "downloaded_at": datetime.now().isoformat(),
                 "metadata": metadata or {}
@@ -139,13 +279,13 @@ class DataEnrichmentService:
             
         except ValidationError as e:
             logger.error(f"Validation error during download: {str(e)}")
-            if temp_path.exists():
-                temp_path.unlink()
+            if temp_path:
+                temp_path.unlink(missing_ok=True)
             raise
         except Exception as e:
             logger.error(f"Error downloading file: {str(e)}")
-            if temp_path.exists():
-                temp_path.unlink()
+            if temp_path:
+                temp_path.unlink(missing_ok=True)
             raise ProcessingError(f"File download failed: {str(e)}")
     
     async def enrich_document(
@@ -1,58 +1,155 @@
 import asyncio
+import inspect
 from typing import List, Optional
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 from firecrawl import FirecrawlClient
-from redis import Redis
-import json
+from redis.asyncio import BlockingConnectionPool, Redis as AsyncRedis
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
 
 class SpecCrawler:
-    def __init__(self, api_key: str, redis_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        redis_url: str,
+        max_concurrency: int = 16,
+        max_requests_per_second: float = 50,
+        local_cache_size: int = 4096,
+        local_cache_ttl: int = 3600,
+        redis_max_connections: int = 64
+    ):
         self.client = FirecrawlClient(api_key)
-        self.redis = Redis.from_url(redis_url)
+        # Callers wait for a free connection rather than erroring once the
+        # pool is exhausted; keepalive avoids reconnects between batches
+        self._redis_pool = BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=redis_max_connections,
+            socket_keepalive=True
+        )
+        self.redis = AsyncRedis(connection_pool=self._redis_pool)
         self.cache_ttl = 86400  # 24 hours
+        # In-process layer in front of Redis for hot components
+        self._local_cache = TTLCache(maxsize=local_cache_size, ttl=local_cache_ttl)
+        # Caps both concurrent crawls and the worker threads they occupy
+        self._crawl_semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        # Keeps large batches under Firecrawl's rate limit instead of
+        # tripping 429s
+        self._rate_limiter = AsyncLimiter(max_requests_per_second, 1)
         logger.info("SpecCrawler initialized")
         
     async def get_component_specs(self, manufacturer: str, model: str) -> Optional[dict]:
         cache_key = f"specs:{manufacturer}:{model}"
         
-        # Check cache first
-        cached = self.redis.get(cache_key)
+        # Check local cache, then Redis
+        specs = self._local_cache.get(cache_key)
+        if specs is not None:
+            return specs
+        
+        cached = await self.redis.get(cache_key)
         if cached:
-            return json.loads(cached)
+            specs = orjson.loads(cached)
+            self._local_cache[cache_key] = specs
+            return specs
             
+        specs = await self._crawl(manufacturer, model)
+        if specs:
+            # Cache the results
+            self._local_cache[cache_key] = specs
+            try:
+                await self.redis.setex(
+                    cache_key,
+                    self.cache_ttl,
+                    orjson.dumps(specs)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache specs for {cache_key}: {str(e)}")
+        return specs
+    
+    async def _crawl(self, manufacturer: str, model: str) -> Optional[dict]:
         try:
-            specs = await self.client.crawl_product_specs(
+            crawl = self.client.crawl_product_specs
+            kwargs = dict(
                 manufacturer=manufacturer,
                 model=model,
                 include_datasheets=True
             )
-            
-            if specs:
-                # Cache the results
-                self.redis.setex(
-                    cache_key,
-                    self.cache_ttl,
-                    json.dumps(specs)
-                )
-                return specs
+            async with self._crawl_semaphore, self._rate_limiter:
+                if inspect.iscoroutinefunction(crawl):
+                    specs = await crawl(**kwargs)
+                else:
+                    # Blocking client; keep it off the event loop
+                    specs = await asyncio.to_thread(crawl, **kwargs)
+            return specs or None
                 
         except Exception as e:
             logger.error(f"Crawl failed for {manufacturer} {model}: {str(e)}")
             return None
             
     async def batch_crawl_specs(self, components: List[dict]) -> dict:
-        tasks = []
+        components = [
+            comp for comp in components
+            if comp.get('manufacturer') and comp.get('model')
+        ]
+        if not components:
+            return {}
+        
+        results = {}
+        remote = []
         for comp in components:
-            if comp.get('manufacturer') and comp.get('model'):
-                tasks.append(self.get_component_specs(
-                    comp['manufacturer'],
-                    comp['model']
-                ))
-                
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        return {
-            comp['id']: result for comp, result in zip(components, results)
-            if not isinstance(result, Exception)
-        } 
\ No newline at end of file
+            key = f"specs:{comp['manufacturer']}:{comp['model']}"
+            specs = self._local_cache.get(key)
+            if specs is not None:
+                results[comp['id']] = specs
+            else:
+                remote.append((comp, key))
+        
+        # One MGET resolves the remaining lookups in a single round-trip
+        misses = []
+        if remote:
+            try:
+                cached = await self.redis.mget([key for _, key in remote])
+            except Exception as e:
+                # Treat every remote key as a miss and crawl them all
+                logger.warning(f"Failed to read {len(remote)} cached specs: {str(e)}")
+                cached = [None] * len(remote)
+            for (comp, key), value in zip(remote, cached):
+                if value:
+                    specs = orjson.loads(value)
+                    self._local_cache[key] = specs
+                    results[comp['id']] = specs
+                else:
+                    misses.append((comp, key))
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._crawl(comp['manufacturer'], comp['model']))
+                for comp, _ in misses
+            ]
+        
+        fresh = []
+        for (comp, key), task in zip(misses, tasks):
+            specs = task.result()
+            results[comp['id']] = specs
+            if specs:
+                self._local_cache[key] = specs
+                fresh.append((key, specs))
+        
+        if fresh:
+            # Best-effort: a Redis failure must not discard the crawl results
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key, specs in fresh:
+                        pipe.setex(key, self.cache_ttl, orjson.dumps(specs))
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to cache {len(fresh)} crawled specs: {str(e)}")
+        
+        return results
+    
+    async def aclose(self) -> None:
+        """Close the Redis client and its connection pool"""
+        await self.redis.aclose()
+        await self._redis_pool.disconnect()
@@ -1,4 +1,4 @@
-from httpx import AsyncClient
+from httpx import AsyncClient, AsyncHTTPTransport, Limits
 import os
 import logging
 from typing import Dict
@@ -8,7 +8,17 @@ logger = logging.getLogger(__name__)
 class JinaReaderService:
     def __init__(self):
         self.base_url = "https://r.jina.ai/"
-        self.client = AsyncClient(timeout=30.0)
+        # One pooled HTTP/2 client shared by every read_url call. Pool
+        # limits live on the transport since httpx ignores client-level
+        # limits/http2 when a transport is supplied.
+        self.client = AsyncClient(
+            timeout=30.0,
+            transport=AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        )
     
     async def read_url(self, url: str) -> Dict:
         """Get clean structured data from any URL using Jina Reader API"""
@@ -27,4 +37,8 @@ class JinaReaderService:
             }
         except Exception as e:
             logger.error(f"Jina Reader failed for {url}: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self.client.aclose()
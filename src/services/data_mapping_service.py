@@ -1,9 +1,11 @@
-from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
+import asyncio
 import logging
-import json
+import orjson
+import msgspec
+import fastjsonschema
 import aiofiles
 from pathlib import Path
 import openai
@@ -14,6 +16,37 @@ from .rag_memory_service import RAGMemoryService
 
 logger = logging.getLogger(__name__)
 
+# Pretty-printing options matching the previous json.dumps(..., indent=2)
+_ORJSON_PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _dumps_pretty(data: Any) -> str:
+    """Serialize data as indented JSON text"""
+    return orjson.dumps(data, option=_ORJSON_PRETTY).decode()
+
+_MAPPING_ITEMS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["source_field", "target_field", "confidence_score"],
+        "properties": {
+            "confidence_score": {"type": "number", "minimum": 0, "maximum": 1}
+        }
+    }
+}
+
+# Accepts the {"mappings": [...]} shape requested by the prompt as well as
+# a bare list of mappings
+_validate_mapping_response = fastjsonschema.compile({
+    "oneOf": [
+        _MAPPING_ITEMS_SCHEMA,
+        {
+            "type": "object",
+            "required": ["mappings"],
+            "properties": {"mappings": _MAPPING_ITEMS_SCHEMA}
+        }
+    ]
+})
+
 class MappingType(str, Enum):
     """Types of data mapping operations"""
     COMPONENT = "component"
@@ -21,17 +54,15 @@ class MappingType(str, Enum):
     METADATA = "metadata"
     LAYOUT = "layout"
 
-@dataclass
-class MappingExample:
+class MappingExample(msgspec.Struct):
     """Example for few-shot learning"""
     source_data: Dict[str, Any]
     target_fields: Dict[str, Any]
     explanation: str
     confidence_score: float
-    timestamp: datetime
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
 
-@dataclass
-class MappingResult:
+class MappingResult(msgspec.Struct):
     """Result of a data mapping operation"""
     source_field: str
     target_field: str
@@ -39,7 +70,11 @@ class MappingResult:
     confidence_score: float
     mapping_type: MappingType
     is_manual_override: bool = False
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
+
+# Typed codecs for example files; decoding builds MappingExamples directly
+_EXAMPLES_DECODER = msgspec.json.Decoder(List[MappingExample])
+_EXAMPLES_ENCODER = msgspec.json.Encoder()
 
 class DataMappingService:
     """Service for AI-driven data mapping to Visio fields"""
@@ -67,38 +102,81 @@ class DataMappingService:
         
         # Load mapping examples
         self.mapping_examples: Dict[MappingType, List[MappingExample]] = {}
-        self.load_mapping_examples()
+        # Rendered prompt examples per mapping type; cleared whenever the
+        # examples for that type change
+        self._examples_text_cache: Dict[MappingType, str] = {}
+        self._load_mapping_examples_sync()
         
         logger.info(
             f"Initialized DataMappingService with "
             f"{sum(len(examples) for examples in self.mapping_examples.values())} examples"
         )
     
-    async def load_mapping_examples(self) -> None:
-        """Load mapping examples from files"""
+    def _load_mapping_examples_sync(self) -> None:
+        """Load mapping examples from files
+        
+        Example files are small, so they are read synchronously; this runs
+        from __init__ without needing an event loop.
+        """
         try:
             for mapping_type in MappingType:
-                examples_file = self.examples_dir / f"{mapping_type.value}_examples.json"
-                if examples_file.exists():
-                    async with aiofiles.open(examples_file, 'r') as f:
-                        content = await f.read()
-                        examples_data = json.loads(content)
-                        
-                        self.mapping_examples[mapping_type] = []
-                        for example_data in examples_data:
-                            example = MappingExample(
-                                source_data=example_data["source_data"],
-                                target_fields=example_data["target_fields"],
-                                explanation=example_data["explanation"],
-                                confidence_score=example_data["confidence_score"],
-                                timestamp=datetime.fromisoformat(example_data["timestamp"])
-                            )
-                            self.mapping_examples[mapping_type].append(example)
+                examples_file = self._examples_file(mapping_type)
+                try:
+                    with open(examples_file, 'rb') as f:
+                        content = f.read()
+                except FileNotFoundError:
+                    continue
+                
+                self.mapping_examples[mapping_type] = _EXAMPLES_DECODER.decode(content)
+                self._examples_text_cache.pop(mapping_type, None)
         
         except Exception as e:
             logger.error(f"Error loading mapping examples: {str(e)}")
             raise ValidationError(f"Failed to load mapping examples: {str(e)}")
     
+    def _examples_file(self, mapping_type: MappingType) -> Path:
+        """Path of the examples file for a mapping type"""
+        return self.examples_dir / f"{mapping_type.value}_examples.json"
+    
+    async def load_mapping_examples(self) -> None:
+        """Reload mapping examples from files without blocking the event loop"""
+        try:
+            # Read every type's file concurrently
+            loaded = await asyncio.gather(*(
+                self._load_examples_file(mapping_type)
+                for mapping_type in MappingType
+            ))
+            
+            for mapping_type, examples in zip(MappingType, loaded):
+                if examples is not None:
+                    self.mapping_examples[mapping_type] = examples
+                    self._examples_text_cache.pop(mapping_type, None)
+        
+        except Exception as e:
+            logger.error(f"Error loading mapping examples: {str(e)}")
+            raise ValidationError(f"Failed to load mapping examples: {str(e)}")
+    
+    async def _load_examples_file(
+        self,
+        mapping_type: MappingType
+    ) -> Optional[List[MappingExample]]:
+        """Load the examples file for a single mapping type
+        
+        Args:
+            mapping_type: Type of mapping examples to load
+            
+        Returns:
+            Loaded examples, or None if the type has no examples file
+        """
+        examples_file = self._examples_file(mapping_type)
+        try:
+            async with aiofiles.open(examples_file, 'rb') as f:
+                content = await f.read()
+        except FileNotFoundError:
+            return None
+        
+        return _EXAMPLES_DECODER.decode(content)
+    
     async def save_mapping_examples(self, mapping_type: MappingType) -> None:
         """Save mapping examples to file
         
@@ -107,21 +185,12 @@ class DataMappingService:
         """
         try:
             examples = self.mapping_examples.get(mapping_type, [])
-            examples_data = []
-            
-            for example in examples:
-                example_dict = {
-                    "source_data": example.source_data,
-                    "target_fields": example.target_fields,
-                    "explanation": example.explanation,
-                    "confidence_score": example.confidence_score,
-                    "timestamp": example.timestamp.isoformat()
-                }
-                examples_data.append(example_dict)
-            
-            examples_file = self.examples_dir / f"{mapping_type.value}_examples.json"
-            async with aiofiles.open(examples_file, 'w') as f:
-                await f.write(json.dumps(examples_data, indent=2))
+            self._examples_text_cache.pop(mapping_type, None)
+            examples_file = self._examples_file(mapping_type)
+            async with aiofiles.open(examples_file, 'wb') as f:
+                await f.write(
+                    msgspec.json.format(_EXAMPLES_ENCODER.encode(examples), indent=2)
+                )
             
             logger.info(f"Saved {len(examples)} mapping examples for {mapping_type.value}")
             
@@ -144,6 +213,7 @@ class DataMappingService:
             self.mapping_examples[mapping_type] = []
         
         self.mapping_examples[mapping_type].append(example)
+        self._examples_text_cache.pop(mapping_type, None)
         logger.info(f"Added mapping example for {mapping_type.value}")
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
@@ -173,7 +243,8 @@ class DataMappingService:
             prompt = self._create_mapping_prompt(
                 source_data,
                 target_schema,
-                examples
+                examples,
+                mapping_type=mapping_type
             )
             
             # Call LLM API
@@ -197,7 +268,7 @@ class DataMappingService:
                 content={
                     "source_data": source_data,
                     "target_schema": target_schema,
-                    "mappings": [m.__dict__ for m in mappings]
+                    "mappings": [msgspec.structs.asdict(m) for m in mappings]
                 },
                 metadata={
                     "type": "data_mapping",
@@ -242,7 +313,8 @@ class DataMappingService:
         self,
         source_data: Dict[str, Any],
         target_schema: Dict[str, Any],
-        examples: List[MappingExample]
+        examples: List[MappingExample],
+        mapping_type: Optional[MappingType] = None
     ) -> str:
         """Create prompt for data mapping
         
@@ -250,25 +322,27 @@ class DataMappingService:
             source_data: Source data to map
             target_schema: Schema of target fields
             examples: Relevant mapping examples
+            mapping_type: Mapping type the examples belong to; when given,
+                the rendered examples section is cached for that type
             
         Returns:
             Formatted prompt string
         """
-        # Add examples section
-        examples_text = "\nExamples of similar mappings:\n"
-        for i, example in enumerate(examples[:3], 1):  # Use up to 3 examples
-            examples_text += f"\nExample {i}:\n"
-            examples_text += f"Source: {json.dumps(example.source_data, indent=2)}\n"
-            examples_text += f"Target: {json.dumps(example.target_fields, indent=2)}\n"
-            examples_text += f"Explanation: {example.explanation}\n"
+        if mapping_type is None:
+            examples_text = self._render_examples(examples)
+        else:
+            examples_text = self._examples_text_cache.get(mapping_type)
+            if examples_text is None:
+                examples_text = self._render_examples(examples)
+                self._examples_text_cache[mapping_type] = examples_text
         
         return f"""Map the following source data to the target schema fields.
         
 Source Data:
-{json.dumps(source_data, indent=2)}
+{_dumps_pretty(source_data)}
 
 Target Schema:
-{json.dumps(target_schema, indent=2)}
+{_dumps_pretty(target_schema)}
 {examples_text}
 
 Provide mappings in the following JSON format:
@@ -293,6 +367,23 @@ Consider:
 
 Provide detailed explanations for non-obvious mappings."""
     
+    def _render_examples(self, examples: List[MappingExample]) -> str:
+        """Render the examples section of the mapping prompt
+        
+        Args:
+            examples: Mapping examples to render
+            
+        Returns:
+            Formatted examples text
+        """
+        examples_text = "\nExamples of similar mappings:\n"
+        for i, example in enumerate(examples[:3], 1):  # Use up to 3 examples
+            examples_text += f"\nExample {i}:\n"
+            examples_text += f"Source: {_dumps_pretty(example.source_data)}\n"
+            examples_text += f"Target: {_dumps_pretty(example.target_fields)}\n"
+            examples_text += f"Explanation: {example.explanation}\n"
+        return examples_text
+    
     def _parse_mapping_response(
         self,
         response_content: str,
@@ -312,38 +403,27 @@ Provide detailed explanations for non-obvious mappings."""
         """
         try:
             # Parse JSON response
-            mapping_data = json.loads(response_content)
+            mapping_data = orjson.loads(response_content)
             
-            # Validate response structure
-            if not isinstance(mapping_data, list):
-                raise ValidationError("Mapping response must be a list")
-                
-            mappings = []
-            for item in mapping_data:
-                # Validate required fields
-                if not all(k in item for k in ["source_field", "target_field", "confidence"]):
-                    raise ValidationError(
-                        "Each mapping must contain source_field, target_field, and confidence"
-                    )
-                
-                # Validate confidence score
-                if not isinstance(item["confidence"], (int, float)) or \
-                   not 0 <= item["confidence"] <= 1:
-                    raise ValidationError("Confidence must be a float between 0 and 1")
-                
-                # Create validated mapping result
-                mapping = MappingResult(
+            # Validate response structure in one compiled pass
+            _validate_mapping_response(mapping_data)
+            if isinstance(mapping_data, dict):
+                mapping_data = mapping_data["mappings"]
+            
+            return [
+                MappingResult(
                     source_field=str(item["source_field"]),
                     target_field=str(item["target_field"]),
-                    confidence=float(item["confidence"]),
-                    mapping_type=mapping_type,
-                    metadata=item.get("metadata", {})
+                    value=item.get("value"),
+                    confidence_score=float(item["confidence_score"]),
+                    mapping_type=mapping_type
                 )
-                mappings.append(mapping)
-            
-            return mappings
+                for item in mapping_data
+            ]
             
-        except json.JSONDecodeError as e:
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise ValidationError(f"Invalid mapping response: {e.message}")
+        except orjson.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON in mapping response: {str(e)}")
         except Exception as e:
             raise ValidationError(f"Error parsing mapping response: {str(e)}")
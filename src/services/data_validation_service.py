@@ -1,16 +1,97 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from enum import Enum
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+import asyncio
+import ipaddress
+import math
 import re
 import logging
 from datetime import datetime
 from pathlib import Path
-import json
+from urllib.parse import urlsplit
+import numpy as np
+import orjson
 import aiofiles
 from .exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Bounded quantifiers (RFC 5321 local-part/domain limits) cap backtracking
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,63}$')
+# Dot-separated labels can't overlap, so matching is linear in the input
+_HOSTNAME_RE = re.compile(r'^(?:[a-zA-Z0-9-]{1,63}\.)+[a-zA-Z]{2,63}$')
+
+# Upper bound on memoized check results kept per rule
+_RULE_CACHE_SIZE = 4096
+
+# Types whose range checks validate_batch can run column-wise
+_NUMERIC_TYPES = frozenset({"integer", "float"})
+
+# Integers beyond this magnitude don't survive conversion to float64
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+def _exact_as_float(values) -> bool:
+    """Check that every int among values converts to float64 exactly"""
+    return all(
+        -_MAX_EXACT_FLOAT_INT <= v <= _MAX_EXACT_FLOAT_INT
+        for v in values
+        if isinstance(v, int)
+    )
+
+@lru_cache(maxsize=512)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a rule's regex pattern, memoized across calls"""
+    return re.compile(pattern)
+
+def _memoize_validator(
+    func: Callable[[Any], bool]
+) -> Callable[[Any], bool]:
+    """Wrap a custom validator so repeated values reuse earlier results
+    
+    Args:
+        func: Pure validator callable
+        
+    Returns:
+        Memoized validator; unhashable values call func directly
+    """
+    cached = lru_cache(maxsize=1024, typed=True)(func)
+    
+    @wraps(func)
+    def validator(value: Any) -> bool:
+        try:
+            hash(value)
+        except TypeError:
+            return func(value)
+        return cached(value)
+    
+    validator.cache_info = cached.cache_info
+    return validator
+
+def _str_length(value: Any) -> int:
+    """Return len(str(value)) without building the string where possible
+    
+    Args:
+        value: Value whose string length is needed
+        
+    Returns:
+        Length of the value's string form
+    """
+    if type(value) is str:
+        return len(value)
+    if type(value) is int:
+        if value == 0:
+            return 1
+        magnitude = abs(value)
+        digits = int(math.log10(magnitude)) + 1
+        # log10 can land one off near powers of ten for large values
+        if 10 ** (digits - 1) > magnitude:
+            digits -= 1
+        elif 10 ** digits <= magnitude:
+            digits += 1
+        return digits + (value < 0)
+    return len(str(value))
+
 class DataType(str, Enum):
     """Supported data types for validation"""
     STRING = "string"
@@ -44,8 +125,22 @@ class ValidationRule:
     max_value: Optional[Union[int, float]] = None
     allowed_values: Optional[List[Any]] = None
     regex_pattern: Optional[str] = None
+    # Must be pure: results are memoized per value once the rule is added
     custom_validator: Optional[Callable[[Any], bool]] = None
     error_message: Optional[str] = None
+    regex_compiled: Optional[re.Pattern] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Memoized built-in check results keyed by (type, value); rules are
+    # treated as immutable once they have validated data
+    _check_cache: Dict[Tuple[type, Any], Tuple[Tuple[str, str], ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        # Compile once per rule rather than on every validated value
+        if self.regex_pattern is not None:
+            self.regex_compiled = _compile(self.regex_pattern)
 
 @dataclass
 class ValidationResult:
@@ -71,43 +166,78 @@ class DataValidationService:
         
         # Initialize rule storage
         self.validation_rules: Dict[str, Dict[str, List[ValidationRule]]] = {}
-        self.load_validation_rules()
+        # Per-source lookup structures derived from validation_rules; kept
+        # in sync by _rebuild_index whenever a source's rules change
+        self._rules_by_source_field: Dict[str, Dict[str, List[ValidationRule]]] = {}
+        self._required_by_source: Dict[str, frozenset] = {}
+        
+        # Type check per DataType, looked up once per validated value
+        self._type_checkers: Dict[DataType, Callable[[Any], bool]] = {
+            DataType.STRING: lambda v: isinstance(v, str),
+            # bool is a subclass of int but is not an integer value here
+            DataType.INTEGER: lambda v: isinstance(v, int) and not isinstance(v, bool),
+            DataType.FLOAT: lambda v: isinstance(v, (int, float)),
+            DataType.BOOLEAN: lambda v: isinstance(v, bool),
+            DataType.LIST: lambda v: isinstance(v, list),
+            DataType.DICT: lambda v: isinstance(v, dict),
+            DataType.DATE: lambda v: (
+                isinstance(v, (datetime, str)) and self._is_valid_date(v)
+            ),
+            DataType.EMAIL: lambda v: isinstance(v, str) and self._is_valid_email(v),
+            DataType.URL: lambda v: isinstance(v, str) and self._is_valid_url(v),
+            DataType.REGEX: lambda v: isinstance(v, str),
+        }
+        self._load_validation_rules_sync()
         
         logger.info(
             f"Initialized DataValidationService with "
             f"{sum(len(rules) for rules in self.validation_rules.values())} rules"
         )
     
-    async def load_validation_rules(self) -> None:
-        """Load validation rules from configuration files"""
+    def _load_validation_rules_sync(self) -> None:
+        """Load validation rules from configuration files
+        
+        Rule files are small, so they are read synchronously; this runs
+        from __init__ without needing an event loop.
+        """
         try:
             for source in DataSource:
                 config_file = self.rules_dir / f"{source.value}_rules.json"
                 if config_file.exists():
-                    async with aiofiles.open(config_file, 'r') as f:
-                        content = await f.read()
-                        rules_config = json.loads(content)
-                        
-                        self.validation_rules[source.value] = []
-                        for rule_config in rules_config:
-                            rule = ValidationRule(
-                                name=rule_config["name"],
-                                data_type=DataType(rule_config["data_type"]),
-                                required=rule_config.get("required", False),
-                                min_length=rule_config.get("min_length"),
-                                max_length=rule_config.get("max_length"),
-                                min_value=rule_config.get("min_value"),
-                                max_value=rule_config.get("max_value"),
-                                allowed_values=rule_config.get("allowed_values"),
-                                regex_pattern=rule_config.get("regex_pattern"),
-                                error_message=rule_config.get("error_message")
-                            )
-                            self.validation_rules[source.value].append(rule)
+                    # Parse raw bytes directly; no intermediate str
+                    with open(config_file, 'rb') as f:
+                        rules_config = orjson.loads(f.read())
+                    
+                    self.validation_rules[source.value] = []
+                    for rule_config in rules_config:
+                        rule = ValidationRule(
+                            name=rule_config["name"],
+                            data_type=DataType(rule_config["data_type"]),
+                            required=rule_config.get("required", False),
+                            min_length=rule_config.get("min_length"),
+                            max_length=rule_config.get("max_length"),
+                            min_value=rule_config.get("min_value"),
+                            max_value=rule_config.get("max_value"),
+                            allowed_values=rule_config.get("allowed_values"),
+                            regex_pattern=rule_config.get("regex_pattern"),
+                            error_message=rule_config.get("error_message")
+                        )
+                        self.validation_rules[source.value].append(rule)
+                    self._rebuild_index(source.value)
         
         except Exception as e:
             logger.error(f"Error loading validation rules: {str(e)}")
             raise ValidationError(f"Failed to load validation rules: {str(e)}")
     
+    async def reload_validation_rules(self) -> None:
+        """Reload validation rules from configuration files at runtime"""
+        await asyncio.to_thread(self._load_validation_rules_sync)
+        logger.info(
+            f"Reloaded "
+            f"{sum(len(rules) for rules in self.validation_rules.values())} "
+            f"validation rules"
+        )
+    
     async def save_validation_rules(self, source: DataSource) -> None:
         """Save validation rules to configuration file
         
@@ -144,8 +274,12 @@ class DataValidationService:
                 rules_config.append(rule_dict)
             
             config_file = self.rules_dir / f"{source.value}_rules.json"
-            async with aiofiles.open(config_file, 'w') as f:
-                await f.write(json.dumps(rules_config, indent=2))
+            payload = orjson.dumps(
+                rules_config,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+            async with aiofiles.open(config_file, 'wb') as f:
+                await f.write(payload)
             
             logger.info(f"Saved {len(rules)} validation rules for {source.value}")
             
@@ -171,7 +305,13 @@ class DataValidationService:
         if any(r.name == rule.name for r in self.validation_rules[source.value]):
             raise ValidationError(f"Rule with name '{rule.name}' already exists")
         
+        if rule.custom_validator is not None and not hasattr(
+            rule.custom_validator, "cache_info"
+        ):
+            rule.custom_validator = _memoize_validator(rule.custom_validator)
+        
         self.validation_rules[source.value].append(rule)
+        self._rebuild_index(source.value)
         logger.info(f"Added validation rule '{rule.name}' for {source.value}")
     
     def remove_validation_rule(
@@ -190,49 +330,248 @@ class DataValidationService:
                 rule for rule in self.validation_rules[source.value]
                 if rule.name != rule_name
             ]
+            self._rebuild_index(source.value)
             logger.info(f"Removed validation rule '{rule_name}' from {source.value}")
     
+    def _rebuild_index(self, source: str) -> None:
+        """Rebuild the field-name and required-name indexes for a source
+        
+        Args:
+            source: Data source value whose rules changed
+        """
+        rules_by_field: Dict[str, List[ValidationRule]] = {}
+        for rule in self.validation_rules.get(source, []):
+            rules_by_field.setdefault(rule.name, []).append(rule)
+        
+        self._rules_by_source_field[source] = rules_by_field
+        self._required_by_source[source] = frozenset(
+            rule.name for rule in self.validation_rules.get(source, [])
+            if rule.required
+        )
+    
     def validate_data(
         self,
         data: Dict[str, Any],
-        source: DataSource
+        source: DataSource,
+        include_valid: bool = True
     ) -> List[ValidationResult]:
         """Validate data against rules for a specific source
         
         Args:
             data: Data to validate
             source: Source of the data
+            include_valid: Whether to return results for passing checks;
+                pass False to only allocate results for failures
             
         Returns:
             List of validation results
         """
         results = []
-        rules = self.validation_rules.get(source.value, [])
+        rules_by_field = self._rules_by_source_field.get(source.value, {})
+        # All results from one validation run share a timestamp
+        now = datetime.now()
         
         for field_name, value in data.items():
-            field_rules = [r for r in rules if r.name == field_name]
+            for rule in rules_by_field.get(field_name, ()):
+                errors = self._validate_field_fast(value, rule)
+                if errors or include_valid:
+                    results.append(ValidationResult(
+                        is_valid=not errors,
+                        errors=errors,
+                        field_name=field_name,
+                        value=value,
+                        rule_name=rule.name,
+                        timestamp=now
+                    ))
+        
+        # Check for missing required fields
+        required_names = self._required_by_source.get(source.value, frozenset())
+        for name in required_names.difference(data):
+            results.append(ValidationResult(
+                is_valid=False,
+                errors=[{
+                    "type": "missing_required_field",
+                    "message": f"Required field '{name}' is missing"
+                }],
+                field_name=name,
+                value=None,
+                rule_name=name,
+                timestamp=now
+            ))
+        
+        return results
+    
+    def validate_batch(
+        self,
+        records: List[Dict[str, Any]],
+        source: DataSource,
+        include_valid: bool = True
+    ) -> List[List[ValidationResult]]:
+        """Validate many records against the rules for a source
+        
+        Equivalent to calling validate_data on each record, but numeric
+        range and allowed-value checks run once per column with NumPy
+        instead of once per field.
+        
+        Args:
+            records: Records to validate
+            source: Source of the data
+            include_valid: Whether to return results for passing checks
             
-            if not field_rules:
+        Returns:
+            One list of validation results per record, in the same order
+            validate_data would produce them
+        """
+        rules_by_field = self._rules_by_source_field.get(source.value, {})
+        now = datetime.now()
+        
+        # Per-rule columns of results, aligned with records (None if absent
+        # or skipped)
+        columns: Dict[int, List[Optional[ValidationResult]]] = {}
+        for field_name, rules in rules_by_field.items():
+            rows = [i for i, record in enumerate(records) if field_name in record]
+            if not rows:
                 continue
+            values = [records[i][field_name] for i in rows]
             
-            for rule in field_rules:
-                result = self._validate_field(field_name, value, rule)
-                results.append(result)
+            for rule in rules:
+                column: List[Optional[ValidationResult]] = [None] * len(records)
+                columns[id(rule)] = column
+                
+                # Custom validators are arbitrary Python; run them per row
+                if rule.custom_validator is not None:
+                    row_errors = [self._validate_field_fast(v, rule) for v in values]
+                else:
+                    # Huge ints would overflow or round in a float64 column
+                    if self._can_vectorize(rule) and _exact_as_float(values):
+                        checks = self._check_numeric_column(values, rule)
+                    else:
+                        checks = [self._check_value_cached(v, rule) for v in values]
+                    row_errors = [
+                        [
+                            {"type": error_type, "message": message}
+                            for error_type, message in check
+                        ]
+                        for check in checks
+                    ]
+                
+                for i, value, errors in zip(rows, values, row_errors):
+                    if not errors and not include_valid:
+                        continue
+                    column[i] = ValidationResult(
+                        is_valid=not errors,
+                        errors=errors,
+                        field_name=field_name,
+                        value=value,
+                        rule_name=rule.name,
+                        timestamp=now
+                    )
         
-        # Check for missing required fields
-        for rule in rules:
-            if rule.required and rule.name not in data:
+        required_names = self._required_by_source.get(source.value, frozenset())
+        batch_results = []
+        for i, record in enumerate(records):
+            results = [
+                result
+                for field_name in record
+                for rule in rules_by_field.get(field_name, ())
+                if (result := columns[id(rule)][i]) is not None
+            ]
+            for name in required_names.difference(record):
                 results.append(ValidationResult(
                     is_valid=False,
                     errors=[{
                         "type": "missing_required_field",
-                        "message": f"Required field '{rule.name}' is missing"
+                        "message": f"Required field '{name}' is missing"
                     }],
-                    field_name=rule.name,
+                    field_name=name,
                     value=None,
-                    rule_name=rule.name,
-                    timestamp=datetime.now()
+                    rule_name=name,
+                    timestamp=now
                 ))
+            batch_results.append(results)
+        
+        return batch_results
+    
+    @staticmethod
+    def _can_vectorize(rule: ValidationRule) -> bool:
+        """Check whether a rule's checks can all run column-wise
+        
+        Args:
+            rule: Validation rule to inspect
+            
+        Returns:
+            True if the rule only has numeric range/allowed-value checks,
+            with bounds that are exact as float64
+        """
+        return (
+            rule.data_type in _NUMERIC_TYPES
+            and rule.regex_compiled is None
+            and rule.min_length is None
+            and rule.max_length is None
+            and (
+                rule.allowed_values is None
+                or all(
+                    isinstance(v, (int, float)) and not isinstance(v, bool)
+                    for v in rule.allowed_values
+                )
+            )
+            and _exact_as_float((rule.min_value, rule.max_value))
+            and _exact_as_float(rule.allowed_values or ())
+        )
+    
+    def _check_numeric_column(
+        self,
+        values: List[Any],
+        rule: ValidationRule
+    ) -> List[Tuple[Tuple[str, str], ...]]:
+        """Apply a numeric rule's checks to a whole column of values
+        
+        Args:
+            values: Column of values to validate
+            rule: Validation rule accepted by _can_vectorize
+            
+        Returns:
+            Tuple of (error type, message) pairs for each value
+        """
+        type_ok = np.fromiter(
+            (self._validate_type(v, rule.data_type) for v in values),
+            dtype=bool,
+            count=len(values)
+        )
+        column = np.array(
+            [v if ok else np.nan for v, ok in zip(values, type_ok)],
+            dtype=np.float64
+        )
+        
+        # Comparisons against NaN are False, so mistyped rows never trip
+        # the range checks
+        checks = []
+        if rule.min_value is not None:
+            checks.append((
+                np.less(column, rule.min_value),
+                ("min_value", f"Value must be at least {rule.min_value}")
+            ))
+        if rule.max_value is not None:
+            checks.append((
+                np.greater(column, rule.max_value),
+                ("max_value", f"Value must be at most {rule.max_value}")
+            ))
+        if rule.allowed_values is not None:
+            checks.append((
+                type_ok & ~np.isin(column, rule.allowed_values),
+                ("invalid_value", f"Value must be one of {rule.allowed_values}")
+            ))
+        
+        results: List[Tuple[Tuple[str, str], ...]] = [()] * len(values)
+        invalid_type = (("invalid_type", f"Expected type {rule.data_type.value}"),)
+        for i in np.flatnonzero(~type_ok):
+            results[i] = invalid_type
+        
+        failing = np.zeros(len(values), dtype=bool)
+        for mask, _ in checks:
+            failing |= mask
+        for i in np.flatnonzero(failing):
+            results[i] = tuple(error for mask, error in checks if mask[i])
         
         return results
     
@@ -240,7 +579,8 @@ class DataValidationService:
         self,
         field_name: str,
         value: Any,
-        rule: ValidationRule
+        rule: ValidationRule,
+        now: Optional[datetime] = None
     ) -> ValidationResult:
         """Validate a single field against a rule
         
@@ -248,90 +588,145 @@ class DataValidationService:
             field_name: Name of the field
             value: Value to validate
             rule: Validation rule to apply
+            now: Timestamp for the result; defaults to the current time
             
         Returns:
             Validation result
         """
-        errors = []
+        errors = self._validate_field_fast(value, rule)
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            field_name=field_name,
+            value=value,
+            rule_name=rule.name,
+            timestamp=now or datetime.now()
+        )
+    
+    def _validate_field_fast(
+        self,
+        value: Any,
+        rule: ValidationRule
+    ) -> List[Dict[str, Any]]:
+        """Validate a single value against a rule without building a result
         
+        Args:
+            value: Value to validate
+            rule: Validation rule to apply
+            
+        Returns:
+            List of errors; empty if the value is valid
+        """
+        errors = [
+            {"type": error_type, "message": message}
+            for error_type, message in self._check_value_cached(value, rule)
+        ]
+        
+        # Custom validator (skipped when the type check already failed)
+        if rule.custom_validator is not None and not (
+            errors and errors[0]["type"] == "invalid_type"
+        ):
+            try:
+                if not rule.custom_validator(value):
+                    errors.append({
+                        "type": "custom_validation",
+                        "message": rule.error_message or "Custom validation failed"
+                    })
+            except Exception as e:
+                errors.append({
+                    "type": "custom_validation_error",
+                    "message": f"Custom validator error: {str(e)}"
+                })
+        
+        return errors
+    
+    def _check_value_cached(
+        self,
+        value: Any,
+        rule: ValidationRule
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Run the built-in checks for a value, memoized on the rule
+        
+        Results are cached per rule keyed by (type, value) so that 1, 1.0
+        and True are checked separately. Unhashable values bypass the cache.
+        
+        Args:
+            value: Value to validate
+            rule: Validation rule to apply
+            
+        Returns:
+            Tuple of (error type, message) pairs
+        """
+        key = (type(value), value)
+        try:
+            cached = rule._check_cache.get(key)
+        except TypeError:
+            return self._check_value(value, rule)
+        
+        if cached is None:
+            cached = self._check_value(value, rule)
+            if len(rule._check_cache) >= _RULE_CACHE_SIZE:
+                rule._check_cache.clear()
+            rule._check_cache[key] = cached
+        return cached
+    
+    def _check_value(
+        self,
+        value: Any,
+        rule: ValidationRule
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Apply a rule's type, length, range, allowed-value and pattern checks
+        
+        Args:
+            value: Value to validate
+            rule: Validation rule to apply
+            
+        Returns:
+            Tuple of (error type, message) pairs
+        """
         # Type validation
         if not self._validate_type(value, rule.data_type):
-            errors.append({
-                "type": "invalid_type",
-                "message": f"Expected type {rule.data_type.value}"
-            })
-            return ValidationResult(
-                is_valid=False,
-                errors=errors,
-                field_name=field_name,
-                value=value,
-                rule_name=rule.name,
-                timestamp=datetime.now()
-            )
+            return (("invalid_type", f"Expected type {rule.data_type.value}"),)
+        
+        errors = []
+        
+        # String form shared by the length and pattern checks, built at
+        # most once
+        value_str = value if isinstance(value, str) else None
         
         # Length validation
-        if rule.min_length is not None and len(str(value)) < rule.min_length:
-            errors.append({
-                "type": "min_length",
-                "message": f"Length must be at least {rule.min_length}"
-            })
-        
-        if rule.max_length is not None and len(str(value)) > rule.max_length:
-            errors.append({
-                "type": "max_length",
-                "message": f"Length must be at most {rule.max_length}"
-            })
+        if rule.min_length is not None or rule.max_length is not None:
+            if value_str is None and type(value) is not int:
+                value_str = str(value)
+            length = len(value_str) if value_str is not None else _str_length(value)
+            if rule.min_length is not None and length < rule.min_length:
+                errors.append(("min_length", f"Length must be at least {rule.min_length}"))
+            
+            if rule.max_length is not None and length > rule.max_length:
+                errors.append(("max_length", f"Length must be at most {rule.max_length}"))
         
         # Value range validation
         if rule.min_value is not None and value < rule.min_value:
-            errors.append({
-                "type": "min_value",
-                "message": f"Value must be at least {rule.min_value}"
-            })
+            errors.append(("min_value", f"Value must be at least {rule.min_value}"))
         
         if rule.max_value is not None and value > rule.max_value:
-            errors.append({
-                "type": "max_value",
-                "message": f"Value must be at most {rule.max_value}"
-            })
+            errors.append(("max_value", f"Value must be at most {rule.max_value}"))
         
         # Allowed values validation
         if rule.allowed_values is not None and value not in rule.allowed_values:
-            errors.append({
-                "type": "invalid_value",
-                "message": f"Value must be one of {rule.allowed_values}"
-            })
+            errors.append(("invalid_value", f"Value must be one of {rule.allowed_values}"))
         
         # Regex pattern validation
-        if rule.regex_pattern is not None:
-            if not re.match(rule.regex_pattern, str(value)):
-                errors.append({
-                    "type": "pattern_mismatch",
-                    "message": rule.error_message or "Value does not match pattern"
-                })
-        
-        # Custom validator
-        if rule.custom_validator is not None:
-            try:
-                if not rule.custom_validator(value):
-                    errors.append({
-                        "type": "custom_validation",
-                        "message": rule.error_message or "Custom validation failed"
-                    })
-            except Exception as e:
-                errors.append({
-                    "type": "custom_validation_error",
-                    "message": f"Custom validator error: {str(e)}"
-                })
+        if rule.regex_compiled is not None:
+            if value_str is None:
+                value_str = str(value)
+            if not rule.regex_compiled.match(value_str):
+                errors.append((
+                    "pattern_mismatch",
+                    rule.error_message or "Value does not match pattern"
+                ))
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            field_name=field_name,
-            value=value,
-            rule_name=rule.name,
-            timestamp=datetime.now()
-        )
+        return tuple(errors)
     
     def _validate_type(self, value: Any, expected_type: DataType) -> bool:
         """Validate value against expected type
@@ -343,28 +738,11 @@ class DataValidationService:
         Returns:
             True if type is valid, False otherwise
         """
-        try:
-            if expected_type == DataType.STRING:
-                return isinstance(value, str)
-            elif expected_type == DataType.INTEGER:
-                return isinstance(value, int)
-            elif expected_type == DataType.FLOAT:
-                return isinstance(value, (int, float))
-            elif expected_type == DataType.BOOLEAN:
-                return isinstance(value, bool)
-            elif expected_type == DataType.LIST:
-                return isinstance(value, list)
-            elif expected_type == DataType.DICT:
-                return isinstance(value, dict)
-            elif expected_type == DataType.DATE:
-                return isinstance(value, (datetime, str)) and self._is_valid_date(value)
-            elif expected_type == DataType.EMAIL:
-                return isinstance(value, str) and self._is_valid_email(value)
-            elif expected_type == DataType.URL:
-                return isinstance(value, str) and self._is_valid_url(value)
-            elif expected_type == DataType.REGEX:
-                return isinstance(value, str)
+        checker = self._type_checkers.get(expected_type)
+        if checker is None:
             return False
+        try:
+            return checker(value)
         except Exception:
             return False
     
@@ -379,6 +757,11 @@ class DataValidationService:
         """
         if isinstance(value, datetime):
             return True
+        # Every ISO 8601 form fromisoformat accepts starts with a four-digit
+        # year and is at least 7 characters ("2024W10"), so reject anything
+        # else without paying for the exception path
+        if len(value) < 7 or not value[:4].isdigit():
+            return False
         try:
             datetime.fromisoformat(value)
             return True
@@ -394,8 +777,7 @@ class DataValidationService:
         Returns:
             True if valid email, False otherwise
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, value))
+        return bool(_EMAIL_RE.match(value))
     
     def _is_valid_url(self, value: str) -> bool:
         """Check if value is a valid URL
@@ -406,8 +788,28 @@ class DataValidationService:
         Returns:
             True if valid URL, False otherwise
         """
-        pattern = r'^https?:\/\/(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&\/=]*)$'
-        return bool(re.match(pattern, value))
+        # Cheap prefix test first, then a structural parse instead of one
+        # large backtracking pattern
+        if not value.startswith(('http://', 'https://')):
+            return False
+        if any(c.isspace() for c in value):
+            return False
+        try:
+            parts = urlsplit(value)
+            parts.port  # Raises ValueError on a malformed port
+        except ValueError:
+            return False
+        
+        hostname = parts.hostname
+        if not hostname:
+            return False
+        # IP literals: IPv4, or IPv6 (urlsplit strips the brackets)
+        try:
+            ipaddress.ip_address(hostname)
+            return True
+        except ValueError:
+            pass
+        return bool(len(hostname) <= 253 and _HOSTNAME_RE.match(hostname))
 
 # Limitations:
 # 1. No support for nested object validation
@@ -1,20 +1,98 @@
 from typing import List, Dict, Optional, Union, Any, Tuple
 from pydantic import BaseModel
 from .exceptions import ValidationError
+from ..models.validation_models import ValidationIssue, ValidationSeverity
+from ._contrast_kernels import contrast_ratios as _contrast_ratios_jit
 import logging
-from wcag_contrast_ratio import rgb_to_luminance, contrast_ratio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from cachetools import LRUCache
 import asyncio
 import gc
+import hashlib
+import json
+import os
+import tempfile
 from contextlib import asynccontextmanager
 import colorsys
 import re
 import math
+import numpy as np
+from scipy.spatial import cKDTree
 from PIL import Image, ImageDraw, ImageFont
 
 logger = logging.getLogger(__name__)
 
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Default cap on validators running at once per DeepValidator; override
+# with the 'max_concurrent_validators' config key
+MAX_CONCURRENT_VALIDATORS = 5
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(color: str) -> Optional[bytes]:
+    """Parse a '#RRGGBB' string into three RGB bytes, or None if malformed"""
+    try:
+        digits = color[1:] if color.startswith('#') else color
+        if len(digits) != 6:
+            return None
+        rgb = bytes.fromhex(digits)
+        return rgb if len(rgb) == 3 else None
+    except Exception:
+        return None
+
+def _relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG relative luminance for an (N, 3) array of 8-bit RGB colors"""
+    channels = rgb / 255.0
+    linear = np.where(
+        channels <= 0.03928,
+        channels / 12.92,
+        ((channels + 0.055) / 1.055) ** 2.4
+    )
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+# Below this many pairs the JIT kernel's call overhead isn't worth it
+_JIT_MIN_PAIRS = 16
+
+def _contrast_ratios(fg_rgb: np.ndarray, bg_rgb: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratios for matching rows of two (N, 3) RGB arrays"""
+    if len(fg_rgb) >= _JIT_MIN_PAIRS:
+        return _contrast_ratios_jit(
+            np.ascontiguousarray(fg_rgb, dtype=np.uint8),
+            np.ascontiguousarray(bg_rgb, dtype=np.uint8)
+        )
+    fg_lum = _relative_luminance(fg_rgb)
+    bg_lum = _relative_luminance(bg_rgb)
+    return (
+        (np.maximum(fg_lum, bg_lum) + 0.05)
+        / (np.minimum(fg_lum, bg_lum) + 0.05)
+    )
+
+# Diagrams reuse a handful of colors across many elements, so single-pair
+# contrast is memoized on the parsed RGB values
+@lru_cache(maxsize=1024)
+def _contrast(fg: Tuple[int, int, int], bg: Tuple[int, int, int]) -> float:
+    """Contrast ratio between two RGB colors"""
+    return float(_contrast_ratios(
+        np.array([fg], dtype=np.uint8),
+        np.array([bg], dtype=np.uint8)
+    )[0])
+
+def _build_issues(rows: List[Tuple[str, str, ValidationSeverity, Dict[str, Any]]]) -> List[ValidationIssue]:
+    """Construct issues from (code, message, severity, context) rows
+    
+    The rows are built by the validators themselves, so pydantic
+    validation is skipped.
+    """
+    return [
+        ValidationIssue.model_construct(
+            code=code, message=message, severity=severity, context=context
+        )
+        for code, message, severity, context in rows
+    ]
+
 class TextElement(BaseModel):
     """Represents a text element in the diagram"""
     content: str
@@ -23,60 +101,43 @@ class TextElement(BaseModel):
     background_color: str
     position: Dict[str, float]
 
-class ValidationSeverity(str):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-
-class ValidationIssue(BaseModel):
-    """Represents a validation issue found in the diagram"""
-    message: str
-    severity: ValidationSeverity
-    location: Dict[str, Union[int, str]]
-    element_id: Optional[str] = None
-
-class ValidationResult(BaseModel):
-    """Result of a single validation check"""
-    passed: bool
-    issues: List[ValidationIssue] = []
-
-class ValidationReport(BaseModel):
-    """Complete validation report for a diagram"""
-    overall_status: str
-    validation_results: List[ValidationResult]
-    total_issues: int
-    critical_issues: int
-    timestamp: str
-
-@dataclass
-class ValidationResult:
-    """Result of a validation check"""
-    passed: bool
-    issues: List[Dict[str, Any]]
-    validation_time: datetime = datetime.now()
-
 class ResourceManager:
     """Manages resources for validation operations"""
-    def __init__(self):
-        self.active_validations = 0
-        self.max_concurrent = 5
-        self._lock = asyncio.Lock()
+    def __init__(self, max_concurrent: int = 5, gc_interval: float = 60.0):
+        self.max_concurrent = max_concurrent
+        self.gc_interval = gc_interval
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._gc_task: Optional[asyncio.Task] = None
+    
+    @property
+    def active_validations(self) -> int:
+        """Number of validations currently holding a slot"""
+        return self.max_concurrent - self._semaphore._value
     
     @asynccontextmanager
     async def validation_context(self):
         """Context manager for validation resources"""
-        try:
-            async with self._semaphore:
-                async with self._lock:
-                    self.active_validations += 1
-                yield
-        finally:
-            async with self._lock:
-                self.active_validations -= 1
-                if self.active_validations == 0:
-                    # Cleanup when no active validations
-                    gc.collect()
+        if self._gc_task is None or self._gc_task.done():
+            self._gc_task = asyncio.create_task(self._periodic_gc())
+        async with self._semaphore:
+            yield
+    
+    async def _periodic_gc(self) -> None:
+        """Collect garbage on an interval while no validations are running
+        
+        Runs in the background so a full collection never lands on the
+        request path.
+        """
+        while True:
+            await asyncio.sleep(self.gc_interval)
+            if self.active_validations == 0:
+                gc.collect()
+    
+    async def aclose(self) -> None:
+        """Stop the background cleanup task"""
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            self._gc_task = None
 
 @dataclass
 class ColorAccessibilityResult:
@@ -84,8 +145,9 @@ class ColorAccessibilityResult:
     is_accessible: bool
     contrast_ratio: float
     wcag_level: str  # 'AA', 'AAA', or 'Fail'
-    foreground_color: Tuple[int, int, int]
-    background_color: Tuple[int, int, int]
+    foreground_color: Optional[Tuple[int, int, int]]
+    background_color: Optional[Tuple[int, int, int]]
+    issues: List[ValidationIssue] = field(default_factory=list)
 
 @dataclass
 class TextReadabilityResult:
@@ -93,7 +155,7 @@ class TextReadabilityResult:
     flesch_score: float
     grade_level: float
     is_readable: bool
-    issues: List[str]
+    issues: List[ValidationIssue]
 
 @dataclass
 class SpacingResult:
@@ -101,15 +163,61 @@ class SpacingResult:
     min_spacing: float
     is_sufficient: bool
     crowded_areas: List[Dict[str, Any]]
+    issues: List[ValidationIssue] = field(default_factory=list)
+
+class ValidationResult(BaseModel):
+    """Result of a full diagram validation"""
+    passed: bool
+    score: float = 0.0
+    issues: List[ValidationIssue] = []
+    color_results: Optional[ColorAccessibilityResult] = None
+    text_results: Optional[TextReadabilityResult] = None
+    spacing_result: Optional[SpacingResult] = None
+    metadata: Dict[str, Any] = {}
+
+class ValidationReport(BaseModel):
+    """Complete validation report for a diagram"""
+    overall_status: str
+    validation_results: List[ValidationResult]
+    total_issues: int
+    critical_issues: int
+    timestamp: str
+
+@dataclass
+class ElementsSoA:
+    """Diagram element geometry as parallel arrays, one entry per element"""
+    x: np.ndarray
+    y: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    ids: List[Optional[str]]
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+
+@dataclass
+class TextSoA:
+    """Text element fields as parallel arrays, one entry per element"""
+    font_size: np.ndarray
+    content: List[str]
+    length: np.ndarray
 
 class DeepValidator:
     """Enhanced validator for diagram accessibility and best practices"""
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        self.resource_manager = ResourceManager()
+        self.resource_manager = ResourceManager(
+            self.config.get('max_concurrent_validators', MAX_CONCURRENT_VALIDATORS)
+        )
         self._setup_logging()
         self._setup_validation_rules()
+        
+        # Validation results keyed by a hash of the diagram: a small
+        # in-memory LRU, in front of an on-disk cache if 'cache_dir' is set
+        self._result_cache: LRUCache = LRUCache(maxsize=128)
+        cache_dir = self.config.get('cache_dir')
+        self.cache_dir = Path(cache_dir) if cache_dir else None
     
     def _setup_logging(self):
         """Configure logging"""
@@ -143,42 +251,63 @@ class DeepValidator:
     ) -> ColorAccessibilityResult:
         """Validate color accessibility"""
         try:
-            issues = []
-            all_contrasts = []
+            rows = []
+            min_contrast = self.color_rules['min_contrast_normal']
             
-            for color_pair in colors:
-                fg = self._parse_color(color_pair['foreground'])
-                bg = self._parse_color(color_pair['background'])
-                
+            parsed = [
+                (
+                    color_pair,
+                    _hex_to_rgb(color_pair['foreground']),
+                    _hex_to_rgb(color_pair['background'])
+                )
+                for color_pair in colors
+            ]
+            valid = [fg + bg for _, fg, bg in parsed if fg and bg]
+            
+            # Compute every pair's contrast in one vectorized pass over the
+            # raw RGB bytes
+            if valid:
+                rgb = np.frombuffer(b"".join(valid), dtype=np.uint8).reshape(-1, 2, 3)
+                ratios = _contrast_ratios(rgb[:, 0], rgb[:, 1])
+            else:
+                ratios = np.empty(0)
+            all_contrasts = ratios.tolist()
+            
+            fg = bg = None
+            contrasts = iter(all_contrasts)
+            for color_pair, fg, bg in parsed:
                 if not fg or not bg:
-                    issues.append(ValidationIssue(
-                        code="COLOR_001",
-                        message="Invalid color format",
-                        severity=ValidationSeverity.ERROR,
-                        context={'colors': color_pair}
+                    rows.append((
+                        "COLOR_001",
+                        "Invalid color format",
+                        ValidationSeverity.ERROR,
+                        {'colors': color_pair}
                     ))
                     continue
                 
-                contrast = self._calculate_contrast(fg, bg)
-                all_contrasts.append(contrast)
-                
-                if contrast < self.color_rules['min_contrast_normal']:
-                    issues.append(ValidationIssue(
-                        code="COLOR_002",
-                        message=f"Insufficient contrast ratio: {contrast:.1f}",
-                        severity=ValidationSeverity.ERROR,
-                        context={
+                contrast = next(contrasts)
+                if contrast < min_contrast:
+                    rows.append((
+                        "COLOR_002",
+                        f"Insufficient contrast ratio: {contrast:.1f}",
+                        ValidationSeverity.ERROR,
+                        {
                             'contrast': contrast,
-                            'colors': color_pair
+                            'colors': color_pair,
+                            'suggested_foreground': self._suggest_accessible_color(
+                                tuple(fg), tuple(bg), min_contrast
+                            )
                         }
                     ))
+            issues = _build_issues(rows)
             
             return ColorAccessibilityResult(
-                is_accessible=all(c >= self.color_rules['min_contrast_normal'] for c in all_contrasts),
-                contrast_ratio=sum(all_contrasts) / len(all_contrasts) if all_contrasts else 0,
-                wcag_level='AA' if all(c >= 7.0 for c in all_contrasts) else 'Fail',
-                foreground_color=fg,
-                background_color=bg
+                is_accessible=bool(np.all(ratios >= min_contrast)),
+                contrast_ratio=float(ratios.mean()) if ratios.size else 0,
+                wcag_level='AA' if bool(np.all(ratios >= 7.0)) else 'Fail',
+                foreground_color=tuple(fg) if fg else None,
+                background_color=tuple(bg) if bg else None,
+                issues=issues
             )
             
         except Exception as e:
@@ -191,38 +320,46 @@ class DeepValidator:
     ) -> TextReadabilityResult:
         """Validate text readability"""
         try:
-            issues = []
-            readability_scores = []
+            rows = []
+            # Read the thresholds once rather than per element
+            min_size = self.text_rules['min_size_normal']
+            max_length = self.text_rules['max_length_desc']
             
-            for element in text_elements:
-                # Validate font size
-                size = element.get('font_size', 0)
-                if size < self.text_rules['min_size_normal']:
-                    issues.append(ValidationIssue(
-                        code="TEXT_001",
-                        message=f"Font size too small: {size}pt",
-                        severity=ValidationSeverity.WARNING,
-                        context={'element': element}
+            text = self._text_to_soa(text_elements)
+            too_small = text.font_size < min_size
+            too_long = text.length > max_length
+            
+            # Only elements with at least one problem are visited in Python
+            for i in np.flatnonzero(too_small | too_long):
+                element = text_elements[i]
+                if too_small[i]:
+                    rows.append((
+                        "TEXT_001",
+                        f"Font size too small: {element.get('font_size', 0)}pt",
+                        ValidationSeverity.WARNING,
+                        {'element': element}
                     ))
-                
-                # Validate text length
-                content = element.get('content', '')
-                if len(content) > self.text_rules['max_length_desc']:
-                    issues.append(ValidationIssue(
-                        code="TEXT_002",
-                        message="Text content too long",
-                        severity=ValidationSeverity.WARNING,
-                        context={'element': element}
+                if too_long[i]:
+                    rows.append((
+                        "TEXT_002",
+                        "Text content too long",
+                        ValidationSeverity.WARNING,
+                        {'element': element}
                     ))
-                
-                # Calculate readability score
-                score = self._calculate_readability(content)
-                readability_scores.append(score)
+            issues = _build_issues(rows)
+            
+            readability_scores = [
+                self._calculate_readability(content) for content in text.content
+            ]
             
+            mean_score = (
+                sum(readability_scores) / len(readability_scores)
+                if readability_scores else 0
+            )
             return TextReadabilityResult(
-                flesch_score=sum(readability_scores) / len(readability_scores) if readability_scores else 0,
-                grade_level=self._calculate_grade_level(sum(readability_scores) / len(readability_scores) if readability_scores else 0),
-                is_readable=sum(readability_scores) / len(readability_scores) >= 60,
+                flesch_score=mean_score,
+                grade_level=self._calculate_grade_level(mean_score),
+                is_readable=mean_score >= 60,
                 issues=issues
             )
             
@@ -236,47 +373,51 @@ class DeepValidator:
     ) -> SpacingResult:
         """Validate element spacing"""
         try:
-            issues = []
+            rows = []
             crowded_areas = []
+            # Read each element dict once; the checks below use the arrays
+            geometry = self._elements_to_soa(elements)
             
             # Check minimum spacing between elements
-            for i, elem1 in enumerate(elements):
-                for elem2 in elements[i+1:]:
-                    distance = self._calculate_distance(elem1, elem2)
-                    
-                    if distance < self.spacing_rules['min_gap']:
-                        crowded_areas.append({
-                            'elements': [elem1.get('id'), elem2.get('id')],
-                            'distance': distance
-                        })
-                        
-                        issues.append(ValidationIssue(
-                            code="SPACING_001",
-                            message=f"Elements too close: {distance:.1f}px",
-                            severity=ValidationSeverity.WARNING,
-                            context={
-                                'elements': [elem1, elem2],
-                                'distance': distance
-                            }
-                        ))
+            for i, j, distance in self._find_crowded_pairs(
+                geometry,
+                self.spacing_rules['min_gap']
+            ):
+                elem1, elem2 = elements[i], elements[j]
+                crowded_areas.append({
+                    'elements': [geometry.ids[i], geometry.ids[j]],
+                    'distance': distance
+                })
+                
+                rows.append((
+                    "SPACING_001",
+                    f"Elements too close: {distance:.1f}px",
+                    ValidationSeverity.WARNING,
+                    {
+                        'elements': [elem1, elem2],
+                        'distance': distance
+                    }
+                ))
             
             # Calculate overall spacing score
-            total_area = self._calculate_total_area(elements)
-            used_area = self._calculate_used_area(elements)
+            total_area = self._calculate_total_area(geometry)
+            used_area = self._calculate_used_area(geometry)
             density = used_area / total_area if total_area > 0 else 1
             
             if density > self.spacing_rules['max_density']:
-                issues.append(ValidationIssue(
-                    code="SPACING_002",
-                    message="Diagram too dense",
-                    severity=ValidationSeverity.WARNING,
-                    context={'density': density}
+                rows.append((
+                    "SPACING_002",
+                    "Diagram too dense",
+                    ValidationSeverity.WARNING,
+                    {'density': density}
                 ))
+            issues = _build_issues(rows)
             
             return SpacingResult(
                 min_spacing=self.spacing_rules['min_gap'],
                 is_sufficient=density <= self.spacing_rules['max_density'],
-                crowded_areas=crowded_areas
+                crowded_areas=crowded_areas,
+                issues=issues
             )
             
         except Exception as e:
@@ -287,14 +428,89 @@ class DeepValidator:
         self,
         diagram_data: Dict[str, Any]
     ) -> ValidationResult:
-        """Perform comprehensive diagram validation"""
+        """Perform comprehensive diagram validation
+        
+        Results are memoized by a hash of the diagram and validator config,
+        in memory and as JSON under cache_dir if one is configured, so
+        re-validating an unchanged diagram returns the stored result.
+        """
+        key = self._diagram_hash(diagram_data)
+        if key in self._result_cache:
+            return self._result_cache[key]
+        
+        if self.cache_dir is None:
+            result = await self._validate_diagram_uncached(diagram_data)
+        else:
+            cache_path = self.cache_dir / f"{key}.json"
+            result = await asyncio.to_thread(self._read_cached_result, cache_path)
+            if result is None:
+                result = await self._validate_diagram_uncached(diagram_data)
+                await asyncio.to_thread(self._write_cached_result, cache_path, result)
+        
+        self._result_cache[key] = result
+        return result
+    
+    def _diagram_hash(self, diagram_data: Dict[str, Any]) -> str:
+        """Content hash of a diagram and the config it is validated with"""
+        payload = json.dumps(
+            {'diagram': diagram_data, 'config': self.config},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def _read_cached_result(self, cache_path: Path) -> Optional[ValidationResult]:
+        """Load a stored validation result, or None if absent or unreadable"""
         try:
-            # Parallel validation
-            color_result, text_result, spacing_result = await asyncio.gather(
-                self.validate_colors(diagram_data.get('colors', [])),
-                self.validate_text(diagram_data.get('text_elements', [])),
-                self.validate_spacing(diagram_data.get('elements', []))
+            with open(cache_path, 'rb') as f:
+                return ValidationResult.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable validation cache entry {cache_path}: {str(e)}")
+            return None
+    
+    def _write_cached_result(self, cache_path: Path, result: ValidationResult) -> None:
+        """Store a validation result atomically; failures are only logged"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(result.model_dump_json())
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not write validation cache entry {cache_path}: {str(e)}")
+    
+    async def _validate_diagram_uncached(
+        self,
+        diagram_data: Dict[str, Any]
+    ) -> ValidationResult:
+        """Run all validators on a diagram"""
+        try:
+            # Parallel validation; let every validator finish so all
+            # failures are reported, not just the first
+            results = await asyncio.gather(
+                self._run_throttled(
+                    self.validate_colors(diagram_data.get('colors', []))
+                ),
+                self._run_throttled(
+                    self.validate_text(diagram_data.get('text_elements', []))
+                ),
+                self._run_throttled(
+                    self.validate_spacing(diagram_data.get('elements', []))
+                ),
+                return_exceptions=True
             )
+            failures = [r for r in results if isinstance(r, BaseException)]
+            if failures:
+                raise ValidationError(
+                    "; ".join(str(failure) for failure in failures)
+                )
+            color_result, text_result, spacing_result = results
             
             # Combine all issues
             all_issues = [
@@ -310,14 +526,19 @@ class DeepValidator:
                 'spacing': 0.3
             }
             
+            element_count = len(diagram_data.get('elements', []))
+            spacing_score = (
+                100 - len(spacing_result.crowded_areas) * 100 / element_count
+                if element_count else 100
+            )
             score = (
                 color_result.contrast_ratio * weights['color'] +
                 text_result.flesch_score * weights['text'] +
-                (100 - spacing_result.crowded_areas.size() * 100 / len(diagram_data.get('elements', []))) * weights['spacing']
+                spacing_score * weights['spacing']
             )
             
             return ValidationResult(
-                passed=len([i for i in all_issues if i.severity == ValidationSeverity.ERROR]) == 0,
+                passed=not any(i.severity == ValidationSeverity.ERROR for i in all_issues),
                 score=score,
                 color_results=color_result,
                 text_results=text_result,
@@ -333,31 +554,161 @@ class DeepValidator:
             logger.error(f"Diagram validation failed: {str(e)}")
             raise ValidationError(f"Diagram validation failed: {str(e)}")
     
-    def _parse_color(self, color: str) -> Optional[Tuple[int, int, int]]:
+    async def _run_throttled(self, coro):
+        """Run a validator under the shared concurrency limit"""
+        async with self.resource_manager.validation_context():
+            return await coro
+    
+    # The helpers below are pure and see the same palette strings, labels
+    # and scores across diagrams, so results are memoized per process
+    # (LRU, 4096 entries each; call e.g. _parse_color.cache_clear() to reset)
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_color(color: str) -> Optional[Tuple[int, int, int]]:
         """Parse color string to RGB tuple"""
-        try:
-            if color.startswith('#'):
-                color = color[1:]
-            if len(color) == 6:
-                return tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-            return None
-        except Exception:
-            return None
+        rgb = _hex_to_rgb(color)
+        return tuple(rgb) if rgb else None
     
     def _calculate_contrast(self, fg: Tuple[int, int, int], bg: Tuple[int, int, int]) -> float:
         """Calculate contrast ratio between two colors"""
         try:
-            fg_lum = rgb_to_luminance(*fg)
-            bg_lum = rgb_to_luminance(*bg)
-            return contrast_ratio(fg_lum, bg_lum)
+            return _contrast(fg, bg)
         except Exception:
             return 0
     
-    def _calculate_readability(self, text: str) -> float:
+    def _elements_to_soa(self, elements: List[Dict[str, Any]]) -> ElementsSoA:
+        """Convert element dicts into parallel geometry arrays"""
+        def column(key: str) -> np.ndarray:
+            return np.fromiter(
+                (e.get(key, 0) for e in elements),
+                dtype=np.float64,
+                count=len(elements)
+            )
+        
+        return ElementsSoA(
+            x=column('x'),
+            y=column('y'),
+            width=column('width'),
+            height=column('height'),
+            ids=[e.get('id') for e in elements]
+        )
+    
+    def _text_to_soa(self, text_elements: List[Dict[str, Any]]) -> TextSoA:
+        """Convert text element dicts into parallel arrays"""
+        content = [e.get('content', '') for e in text_elements]
+        return TextSoA(
+            font_size=np.fromiter(
+                (e.get('font_size', 0) for e in text_elements),
+                dtype=np.float64,
+                count=len(text_elements)
+            ),
+            content=content,
+            length=np.fromiter(
+                (len(c) for c in content),
+                dtype=np.int64,
+                count=len(content)
+            )
+        )
+    
+    def _find_crowded_pairs(
+        self,
+        geometry: ElementsSoA,
+        min_gap: float
+    ) -> List[Tuple[int, int, float]]:
+        """Find element pairs closer than min_gap
+        
+        Returns (i, j, distance) with i < j, in the same order as a nested
+        loop over the elements.
+        """
+        xs, ys = geometry.x, geometry.y
+        
+        # Compare squared distances; only reported pairs need the root
+        min_gap_sq = min_gap * min_gap
+        
+        # Small diagrams aren't worth the array setup
+        if len(geometry) < 32:
+            x_list, y_list = xs.tolist(), ys.tolist()
+            pairs = []
+            for i, (x1, y1) in enumerate(zip(x_list, y_list)):
+                for j in range(i + 1, len(x_list)):
+                    dx = x_list[j] - x1
+                    dy = y_list[j] - y1
+                    if dx * dx + dy * dy < min_gap_sq:
+                        pairs.append((i, j, math.hypot(dx, dy)))
+            return pairs
+        
+        if len(geometry) < 64:
+            dx = xs[:, None] - xs[None, :]
+            dy = ys[:, None] - ys[None, :]
+            rows, cols = np.nonzero(np.triu(dx * dx + dy * dy < min_gap_sq, k=1))
+            return list(zip(
+                rows.tolist(),
+                cols.tolist(),
+                np.hypot(dx[rows, cols], dy[rows, cols]).tolist()
+            ))
+        
+        # Large diagrams: a radius query only visits nearby points instead
+        # of building the full N x N distance matrix
+        points = np.column_stack([xs, ys])
+        pairs = cKDTree(points).query_pairs(r=min_gap, output_type='ndarray')
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        rows, cols = pairs[:, 0], pairs[:, 1]
+        distances = np.hypot(xs[rows] - xs[cols], ys[rows] - ys[cols])
+        # query_pairs includes pairs exactly min_gap apart
+        close = distances < min_gap
+        return list(zip(
+            rows[close].tolist(),
+            cols[close].tolist(),
+            distances[close].tolist()
+        ))
+    
+    def _suggest_accessible_color(
+        self,
+        fg: Tuple[int, int, int],
+        bg: Tuple[int, int, int],
+        target: float = 4.5
+    ) -> Optional[str]:
+        """Suggest a foreground color that meets the target contrast
+        
+        Keeps the foreground's hue and saturation and binary-searches its
+        lightness towards black or white, whichever contrasts more with the
+        background, stopping at the closest lightness that passes.
+        
+        Returns:
+            '#RRGGBB' string, or None if no lightness reaches the target
+        """
+        hue, lightness, saturation = colorsys.rgb_to_hls(*(c / 255 for c in fg))
+        
+        def with_lightness(value: float) -> Tuple[int, int, int]:
+            return tuple(
+                round(c * 255)
+                for c in colorsys.hls_to_rgb(hue, value, saturation)
+            )
+        
+        darken = _contrast((0, 0, 0), bg) >= _contrast((255, 255, 255), bg)
+        extreme = 0.0 if darken else 1.0
+        if _contrast(with_lightness(extreme), bg) < target:
+            return None
+        
+        # Contrast only improves moving from the original lightness towards
+        # the extreme, so the pass/fail boundary can be bisected
+        passing, failing = extreme, lightness
+        while abs(failing - passing) > 1 / 256:
+            mid = (passing + failing) / 2
+            if _contrast(with_lightness(mid), bg) >= target:
+                passing = mid
+            else:
+                failing = mid
+        
+        return '#{:02X}{:02X}{:02X}'.format(*with_lightness(passing))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_readability(text: str) -> float:
         """Calculate text readability score"""
         try:
             words = len(text.split())
-            sentences = len(re.split(r'[.!?]+', text))
+            sentences = len(_SENTENCE_SPLIT_RE.split(text))
             if sentences == 0:
                 return 0
             return min(100, (words / sentences) * 10)
@@ -369,34 +720,41 @@ class DeepValidator:
         try:
             x1, y1 = elem1.get('x', 0), elem1.get('y', 0)
             x2, y2 = elem2.get('x', 0), elem2.get('y', 0)
-            return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+            return math.hypot(x2 - x1, y2 - y1)
         except Exception:
             return float('inf')
     
-    def _calculate_total_area(self, elements: List[Dict[str, Any]]) -> float:
+    def _calculate_total_area(
+        self,
+        elements: Union[List[Dict[str, Any]], ElementsSoA]
+    ) -> float:
         """Calculate total diagram area"""
         try:
-            if not elements:
+            if not isinstance(elements, ElementsSoA):
+                elements = self._elements_to_soa(elements)
+            if not len(elements):
                 return 0
-            xs = [e.get('x', 0) for e in elements]
-            ys = [e.get('y', 0) for e in elements]
-            width = max(xs) - min(xs)
-            height = max(ys) - min(ys)
-            return width * height
+            width = elements.x.max() - elements.x.min()
+            height = elements.y.max() - elements.y.min()
+            return float(width * height)
         except Exception:
             return 0
     
-    def _calculate_used_area(self, elements: List[Dict[str, Any]]) -> float:
+    def _calculate_used_area(
+        self,
+        elements: Union[List[Dict[str, Any]], ElementsSoA]
+    ) -> float:
         """Calculate area used by elements"""
         try:
-            return sum(
-                e.get('width', 0) * e.get('height', 0)
-                for e in elements
-            )
+            if not isinstance(elements, ElementsSoA):
+                elements = self._elements_to_soa(elements)
+            return float(np.dot(elements.width, elements.height))
         except Exception:
             return 0
     
-    def _calculate_grade_level(self, flesch_score: float) -> float:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_grade_level(flesch_score: float) -> float:
         """Calculate grade level based on Flesch Reading Ease score"""
         try:
             if flesch_score < 30:
@@ -1,17 +1,62 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import asyncio
 import logging
 from .base_service import BaseService, ServiceUnavailableError
+from ..utils.batching import RequestBatcher
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# One connection pool shared by every DeepseekService instance, so new
+# instances reuse warm TLS/HTTP2 connections. Reference-counted so the
+# last instance to clean up closes it.
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_refs = 0
+
+def _acquire_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use"""
+    global _shared_client, _shared_client_refs
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=60.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50
+            )
+        )
+        _shared_client_refs = 0
+    _shared_client_refs += 1
+    return _shared_client
+
+async def _release_client(client: httpx.AsyncClient) -> None:
+    """Drop a reference to the shared client, closing it after the last one"""
+    global _shared_client, _shared_client_refs
+    if client is not _shared_client:
+        # Client was replaced after being closed; nothing left to release
+        return
+    _shared_client_refs -= 1
+    if _shared_client_refs <= 0:
+        _shared_client = None
+        await client.aclose()
+
 class DeepseekService(BaseService):
     """Service for interacting with Deepseek's API"""
     
+    # Prompts submitted within BATCH_WINDOW seconds of each other are sent
+    # together, up to BATCH_MAX per request
+    BATCH_MAX = 8
+    BATCH_WINDOW = 0.05
+    BATCH_DELIMITER = "<<<§§§>>>"
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or self._get_api_key()
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = _acquire_client()
+        self._released = False
         self.base_url = "https://api.deepseek.com/v1"
+        self._batcher = RequestBatcher(
+            self.process_batch, self.BATCH_MAX, self.BATCH_WINDOW
+        )
         
     async def initialize(self) -> None:
         """Initialize the Deepseek service"""
@@ -20,7 +65,17 @@ class DeepseekService(BaseService):
             
     async def cleanup(self) -> None:
         """Cleanup resources"""
-        await self.client.aclose()
+        await self._batcher.aclose()
+        if not self._released:
+            self._released = True
+            await _release_client(self.client)
+    
+    async def __aenter__(self) -> "DeepseekService":
+        await self.initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.cleanup()
         
     async def process(
         self,
@@ -61,6 +116,48 @@ class DeepseekService(BaseService):
             logger.error(f"Deepseek API request failed: {str(e)}")
             raise ServiceUnavailableError(f"Deepseek service error: {str(e)}")
             
+    async def process_batch(
+        self,
+        prompts: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Process several prompts with a single API request
+        
+        The prompts are joined with BATCH_DELIMITER and the model is asked
+        to answer each one, separating its answers the same way. If the
+        reply doesn't split into one answer per prompt, the prompts are
+        sent individually instead.
+        """
+        if len(prompts) == 1:
+            return [await self.process(prompts[0], context)]
+        
+        delimiter = self.BATCH_DELIMITER
+        combined = (
+            f"Respond to each request separated by {delimiter}, separating "
+            f"your responses with {delimiter} in the same order. "
+            f"Requests: {delimiter.join(prompts)}"
+        )
+        result = await self.process(combined, context)
+        
+        answers = result["response"].split(delimiter)
+        if len(answers) != len(prompts):
+            logger.warning(
+                f"Deepseek batch reply had {len(answers)} parts for "
+                f"{len(prompts)} prompts; retrying individually"
+            )
+            return list(await asyncio.gather(
+                *(self.process(prompt, context) for prompt in prompts)
+            ))
+        
+        return [
+            {"response": answer.strip(), "metadata": result["metadata"]}
+            for answer in answers
+        ]
+    
+    async def submit(self, prompt: str) -> Dict[str, Any]:
+        """Queue a prompt to be sent with others submitted around the same time"""
+        return await self._batcher.submit(prompt)
+    
     async def health_check(self) -> bool:
         """Check if the service is available"""
         try:
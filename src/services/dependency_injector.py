@@ -7,6 +7,8 @@ logger = logging.getLogger(__name__)
 class DependencyInjector:
     """Manages service dependencies and initialization"""
     
+    __slots__ = ('_services', '_initialized')
+    
     def __init__(self):
         self._services: Dict[str, BaseService] = {}
         self._initialized = False
@@ -28,6 +30,8 @@ class DependencyInjector:
 
     def get(self, name: str) -> BaseService:
         """Get a registered service"""
-        if name not in self._services:
-            raise KeyError(f"Service {name} not registered")
-        return self._services[name] 
\ No newline at end of file
+        # Single hash probe on the hit path
+        try:
+            return self._services[name]
+        except KeyError:
+            raise KeyError(f"Service {name} not registered") from None 
\ No newline at end of file
@@ -6,12 +6,16 @@ class DiagramGenerationService:
     def __init__(self, shape_classifier: ShapeClassifierService):
         self.shape_classifier = shape_classifier
         
-    def generate_diagram(self, components: List[Dict]) -> Diagram:
+    async def generate_diagram(self, components: List[Dict]) -> Diagram:
         """Generate diagram with classified shapes"""
         diagram = Diagram()
         
-        for component in components:
-            shape_type = self.shape_classifier.classify_shape(component["image"])
+        # One batched inference for all components instead of one per shape
+        shape_types = await self.shape_classifier.classify_shape_batch(
+            [component["image"] for component in components]
+        )
+        
+        for component, shape_type in zip(components, shape_types):
             diagram.add_shape(
                 shape_type=shape_type["class_name"],
                 position=component["position"],
@@ -15,7 +15,13 @@ class DiagramService:
     def __init__(self):
         self.visio = None
         self.active_diagram = None
+        # Page 1 and ID of the active diagram, cached to save COM calls
+        self._active_page = None
+        self._active_diagram_id: Optional[str] = None
         self.stencils = {}
+        # NameU -> master, filled when stencils load so lookups skip COM
+        self._master_cache: Dict[str, Any] = {}
+        self._connector_master_cache: Dict[str, Any] = {}
         self._initialize_visio()
         
     def _initialize_visio(self):
@@ -39,18 +45,32 @@ class DiagramService:
                     str(stencil_file),
                     win32com.client.constants.visOpenDocked
                 )
+            self._cache_masters()
             logger.info(f"Loaded {len(self.stencils)} stencils")
         except Exception as e:
             logger.error(f"Failed to load stencils: {str(e)}")
             
+    def _cache_masters(self):
+        """Index every stencil master by universal name in one pass."""
+        for stencil in self.stencils.values():
+            for master in stencil.Masters:
+                # Earlier stencils win, as in the original per-stencil search
+                self._master_cache.setdefault(master.NameU, master)
+        
+        connector_stencil = self.stencils.get("AV_Connectors")
+        if connector_stencil:
+            self._connector_master_cache = {
+                master.NameU: master for master in connector_stencil.Masters
+            }
+            
     async def create_new_diagram(self) -> str:
         """Create a new Visio diagram."""
         try:
-            self.active_diagram = self.visio.Documents.Add("")
-            diagram_id = str(self.active_diagram.ID)
+            self._set_active_diagram(self.visio.Documents.Add(""))
+            diagram_id = self._active_diagram_id
             
             # Set up the drawing page with grid and rulers
-            page = self.active_diagram.Pages.Item(1)
+            page = self._active_page
             page.PageSheet.CellsSRC(
                 win32com.client.constants.visSectionObject,
                 win32com.client.constants.visGridSpacing,
@@ -65,12 +85,22 @@ class DiagramService:
     async def open_diagram(self, file_path: str) -> str:
         """Open an existing Visio diagram."""
         try:
-            self.active_diagram = self.visio.Documents.Open(file_path)
-            return str(self.active_diagram.ID)
+            self._set_active_diagram(self.visio.Documents.Open(file_path))
+            return self._active_diagram_id
         except Exception as e:
             logger.error(f"Failed to open diagram {file_path}: {str(e)}")
             raise
             
+    def _set_active_diagram(self, diagram) -> None:
+        """Make a document active and cache its first page and ID."""
+        self.active_diagram = diagram
+        if diagram is None:
+            self._active_page = None
+            self._active_diagram_id = None
+        else:
+            self._active_page = diagram.Pages.Item(1)
+            self._active_diagram_id = str(diagram.ID)
+            
     async def save_diagram(self, file_path: str) -> bool:
         """Save the current diagram."""
         try:
@@ -88,7 +118,7 @@ class DiagramService:
             if not self.active_diagram:
                 raise ValueError("No active diagram")
                 
-            page = self.active_diagram.Pages.Item(1)
+            page = self._active_page
             master = self._get_component_master(component_type)
             
             if not master:
@@ -102,11 +132,16 @@ class DiagramService:
             
     def _get_component_master(self, component_type: str):
         """Get the master shape for a component type."""
+        master = self._master_cache.get(component_type)
+        if master is not None:
+            return master
         for stencil in self.stencils.values():
             try:
-                return stencil.Masters.ItemU(component_type)
+                master = stencil.Masters.ItemU(component_type)
             except:
                 continue
+            self._master_cache[component_type] = master
+            return master
         return None
         
     async def connect_components(self, from_id: str, to_id: str, connection_type: str) -> str:
@@ -115,7 +150,7 @@ class DiagramService:
             if not self.active_diagram:
                 raise ValueError("No active diagram")
                 
-            page = self.active_diagram.Pages.Item(1)
+            page = self._active_page
             from_shape = page.Shapes.ItemFromID(int(from_id))
             to_shape = page.Shapes.ItemFromID(int(to_id))
             
@@ -135,9 +170,14 @@ class DiagramService:
             
     def _get_connector_master(self, connection_type: str):
         """Get the master shape for a connector type."""
+        master = self._connector_master_cache.get(connection_type)
+        if master is not None:
+            return master
         connector_stencil = self.stencils.get("AV_Connectors")
         if connector_stencil:
-            return connector_stencil.Masters.ItemU(connection_type)
+            master = connector_stencil.Masters.ItemU(connection_type)
+            self._connector_master_cache[connection_type] = master
+            return master
         return None
         
     async def delete_component(self, component_id: str) -> bool:
@@ -146,7 +186,7 @@ class DiagramService:
             if not self.active_diagram:
                 raise ValueError("No active diagram")
                 
-            page = self.active_diagram.Pages.Item(1)
+            page = self._active_page
             shape = page.Shapes.ItemFromID(int(component_id))
             shape.Delete()
             return True
@@ -160,28 +200,46 @@ class DiagramService:
             if not self.active_diagram:
                 return {}
                 
-            page = self.active_diagram.Pages.Item(1)
-            components = []
-            connections = []
+            page = self._active_page
+            component_shapes = []
+            connector_shapes = []
             
-            for shape in page.Shapes:
+            shapes = page.Shapes
+            for index in range(1, shapes.Count + 1):
+                shape = shapes.Item(index)
                 if shape.OneD:  # It's a connector
-                    connections.append({
-                        'id': str(shape.ID),
-                        'type': shape.Name,
-                        'from_id': str(shape.Connects.Item(1).FromSheet.ID),
-                        'to_id': str(shape.Connects.Item(2).FromSheet.ID)
-                    })
+                    connector_shapes.append((shape.ID, shape.Name))
                 else:  # It's a component
-                    components.append({
-                        'id': str(shape.ID),
-                        'type': shape.Name,
-                        'x': shape.Cells('PinX').Result(''),
-                        'y': shape.Cells('PinY').Result('')
-                    })
+                    component_shapes.append((shape.ID, shape.Name))
+            
+            positions = self._get_pin_positions(
+                page, [shape_id for shape_id, _ in component_shapes]
+            )
+            components = [
+                {
+                    'id': str(shape_id),
+                    'type': name,
+                    'x': x,
+                    'y': y
+                }
+                for (shape_id, name), (x, y) in zip(component_shapes, positions)
+            ]
+            
+            glued_ends = self._get_glued_ends(page)
+            begin = win32com.client.constants.visBegin
+            end = win32com.client.constants.visEnd
+            connections = []
+            for shape_id, name in connector_shapes:
+                ends = glued_ends.get(shape_id, {})
+                connections.append({
+                    'id': str(shape_id),
+                    'type': name,
+                    'from_id': str(ends[begin]) if begin in ends else None,
+                    'to_id': str(ends[end]) if end in ends else None
+                })
                     
             return {
-                'id': str(self.active_diagram.ID),
+                'id': self._active_diagram_id,
                 'name': self.active_diagram.Name,
                 'components': components,
                 'connections': connections
@@ -190,11 +248,47 @@ class DiagramService:
             logger.error(f"Failed to get diagram data: {str(e)}")
             raise
             
+    def _get_pin_positions(self, page, shape_ids: List[int]) -> List[tuple]:
+        """Read PinX/PinY for every shape with a single GetResults call."""
+        if not shape_ids:
+            return []
+        constants = win32com.client.constants
+        
+        # SRC stream: (sheet ID, section, row, cell) for each cell read
+        src_stream = []
+        for shape_id in shape_ids:
+            src_stream.extend((
+                shape_id, constants.visSectionObject,
+                constants.visRowXFormOut, constants.visXFormPinX,
+                shape_id, constants.visSectionObject,
+                constants.visRowXFormOut, constants.visXFormPinY
+            ))
+        results = page.GetResults(
+            src_stream,
+            constants.visGetFloats,
+            [constants.visInches] * (2 * len(shape_ids))
+        )
+        return list(zip(results[0::2], results[1::2]))
+        
+    def _get_glued_ends(self, page) -> Dict[int, Dict[int, int]]:
+        """Map each connector ID to the shapes its ends are glued to.
+        
+        Walks the page's Connects collection once instead of querying
+        each connector.
+        """
+        glued_ends: Dict[int, Dict[int, int]] = {}
+        for connect in page.Connects:
+            glued_ends.setdefault(connect.FromSheet.ID, {})[connect.FromPart] = (
+                connect.ToSheet.ID
+            )
+        return glued_ends
+        
     def cleanup(self):
         """Clean up Visio resources."""
         try:
             if self.active_diagram:
                 self.active_diagram.Close()
+                self._set_active_diagram(None)
             if self.visio:
                 self.visio.Quit()
         except Exception as e:
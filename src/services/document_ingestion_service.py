@@ -1,12 +1,15 @@
 import logging
 from pathlib import Path
 from typing import Optional, Set, Dict
-import aiofiles
-import hashlib
+import asyncio
+import os
+import uuid
+import blake3
 from datetime import datetime
 
 from .file_validator_service import FileValidator, FileCategory
 from .exceptions import ValidationError, ProcessingError
+from ..utils.file_copy import copy_and_hash
 
 logger = logging.getLogger(__name__)
 
@@ -63,28 +66,46 @@ class DocumentIngestionService:
         try:
             logger.info(f"Starting ingestion of document: {file_path}")
             
-            # Validate file
+            # Reject oversized files from their size alone before anything
+            # reads them
+            max_size = self.file_validator.max_file_size
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                size = None  # Reported by the validator below
+            if size is not None and size > max_size:
+                raise ValidationError(f"File size exceeds limit of {max_size} bytes")
+            
+            # Validate size and type; the hash comes from the copy below so
+            # the file is only read once
             validation = self.file_validator.validate_file(
                 file_path,
-                allowed_categories=self.allowed_categories
+                allowed_categories=self.allowed_categories,
+                precomputed_size=size,
+                compute_hash=False
             )
+            if not validation.is_valid:
+                raise ValidationError("; ".join(validation.errors))
+            
+            # Copy file to upload directory under a temporary name, since
+            # the final name depends on the hash
+            temp_path = self.upload_dir / f".{uuid.uuid4().hex}.part"
+            file_hash = await self._copy_file(file_path, temp_path)
             
             # Generate unique filename
-            unique_name = self._generate_unique_name(file_path, validation["hash"])
+            unique_name = self._generate_unique_name(file_path, file_hash)
             dest_path = self.upload_dir / unique_name
-            
-            # Copy file to upload directory
-            await self._copy_file(file_path, dest_path)
+            os.replace(temp_path, dest_path)
             
             # Prepare result
             result = {
                 "original_path": str(file_path),
                 "stored_path": str(dest_path),
                 "file_name": unique_name,
-                "size": validation["size"],
-                "mime_type": validation["mime_type"],
-                "category": validation["category"],
-                "hash": validation["hash"],
+                "size": validation.size,
+                "mime_type": validation.mime_type,
+                "category": validation.category,
+                "hash": file_hash,
                 "uploaded_at": datetime.now().isoformat(),
                 "metadata": metadata or {}
             }
@@ -99,21 +120,31 @@ class DocumentIngestionService:
             logger.error(f"Error during document ingestion: {str(e)}")
             raise ProcessingError(f"Document ingestion failed: {str(e)}")
     
-    async def _copy_file(self, src: Path, dst: Path) -> None:
-        """Copy file using async IO"""
+    async def _copy_file(self, src: Path, dst: Path) -> str:
+        """Copy and hash file in a single pass in a worker thread
+        
+        Returns:
+            BLAKE3 hex digest of the file contents
+        """
         try:
-            async with aiofiles.open(src, "rb") as fsrc:
-                async with aiofiles.open(dst, "wb") as fdst:
-                    chunk = await fsrc.read(8192)
-                    while chunk:
-                        await fdst.write(chunk)
-                        chunk = await fsrc.read(8192)
+            file_hash, _, _ = await asyncio.to_thread(
+                copy_and_hash,
+                src,
+                dst,
+                blake3.blake3(),
+                max_size=self.file_validator.max_file_size
+            )
+            return file_hash
+        except ValidationError:
+            dst.unlink(missing_ok=True)
+            raise
         except Exception as e:
+            dst.unlink(missing_ok=True)
             logger.error(f"Error copying file: {str(e)}")
             raise ProcessingError(f"Failed to copy file: {str(e)}")
     
     def _generate_unique_name(self, original_path: Path, file_hash: str) -> str:
         """Generate unique filename using timestamp and hash"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         extension = original_path.suffix
         return f"{timestamp}_{file_hash[:8]}{extension}" 
\ No newline at end of file
@@ -1,6 +1,9 @@
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+import asyncio
 import logging
+import blake3
+from cachetools import LRUCache
 from .exceptions import ProcessingError
 from .rag_memory_service import RAGMemoryService
 from .data_ingestion import JinaReaderService, FirecrawlService
@@ -8,6 +11,18 @@ from langgraph.prebuilt import ToolNode
 
 logger = logging.getLogger(__name__)
 
+def _hash_file(file_path: Path) -> str:
+    """BLAKE3 hex digest of a file's contents"""
+    hasher = blake3.blake3()
+    with open(file_path, "rb") as f:
+        while block := f.read(1024 * 1024):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+# File suffix -> format tag for files read as plain text
+_FORMATS = {'.txt': 'text', '.md': 'markdown', '.json': 'json'}
+_FORMAT_LABELS = {'text': 'Text', 'markdown': 'Markdown', 'json': 'JSON'}
+
 class DocumentProcessingService:
     """Service for processing input documents for LLD generation"""
     
@@ -22,17 +37,22 @@ class DocumentProcessingService:
         self.rag_memory = rag_memory
         self.jina_reader = jina_reader
         self.firecrawl = firecrawl
+        # Processed results keyed by content hash, checked before RAG memory
+        self._result_cache: LRUCache = LRUCache(maxsize=256)
         
     async def process_document(
         self,
         file_path: Path,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """Process an input document for LLD generation
         
         Args:
             file_path: Path to the document file
             context: Optional processing context
+            content_hash: Hash of the file contents if already known (e.g.
+                from ingestion); computed from the file otherwise
             
         Returns:
             Dict containing processed content and metadata
@@ -52,22 +72,24 @@ class DocumentProcessingService:
             if file_path.stat().st_size > max_size:
                 raise ValueError("File size exceeds 50MB limit")
             
-            # Check cache first
-            cache_key = f"doc_process_{file_path.name}_{file_path.stat().st_mtime}"
+            # Check cache first, keyed by content so renamed or copied
+            # files still hit
+            if content_hash is None:
+                content_hash = await asyncio.to_thread(_hash_file, file_path)
+            cache_key = f"doc_process_{content_hash}"
+            if (processed := self._result_cache.get(cache_key)) is not None:
+                return processed
             if cached := await self.rag_memory.query_memory(cache_key):
                 logger.info(f"Found cached processing results for {file_path}")
-                return cached[0].content
+                processed = cached[0].content
+                self._result_cache[cache_key] = processed
+                return processed
             
             # Process based on file type
             file_type = file_path.suffix.lower()
-            if file_type == '.txt':
-                processed = await self._process_text(file_path)
-            elif file_type == '.md':
-                processed = await self._process_markdown(file_path)
-            elif file_type == '.json':
-                processed = await self._process_json(file_path)
-            else:
+            if file_type not in _FORMATS:
                 raise ProcessingError(f"Unsupported file type: {file_type}")
+            processed = await self._read_and_tag(file_path, _FORMATS[file_type])
                 
             # Store in memory
             await self.rag_memory.store_entry(
@@ -78,6 +100,7 @@ class DocumentProcessingService:
                     'cache_key': cache_key
                 }
             )
+            self._result_cache[cache_key] = processed
             
             return processed
             
@@ -85,50 +108,20 @@ class DocumentProcessingService:
             logger.error(f"Error processing document {file_path}: {str(e)}")
             raise ProcessingError(f"Document processing failed: {str(e)}")
             
-    async def _process_text(self, file_path: Path) -> Dict[str, Any]:
-        """Process a text file"""
-        try:
-            with open(file_path) as f:
-                content = f.read()
-                
-            return {
-                'content': content,
-                'format': 'text'
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing text file {file_path}: {str(e)}")
-            raise ProcessingError(f"Text processing failed: {str(e)}")
-            
-    async def _process_markdown(self, file_path: Path) -> Dict[str, Any]:
-        """Process a markdown file"""
+    async def _read_and_tag(self, file_path: Path, fmt: str) -> Dict[str, Any]:
+        """Read a text-based file in a worker thread and tag its format"""
         try:
-            with open(file_path) as f:
-                content = f.read()
-                
-            return {
-                'content': content,
-                'format': 'markdown'
-            }
+            content = await asyncio.to_thread(file_path.read_text)
             
-        except Exception as e:
-            logger.error(f"Error processing markdown file {file_path}: {str(e)}")
-            raise ProcessingError(f"Markdown processing failed: {str(e)}")
-            
-    async def _process_json(self, file_path: Path) -> Dict[str, Any]:
-        """Process a JSON file"""
-        try:
-            with open(file_path) as f:
-                content = f.read()
-                
             return {
                 'content': content,
-                'format': 'json'
+                'format': fmt
             }
             
         except Exception as e:
-            logger.error(f"Error processing JSON file {file_path}: {str(e)}")
-            raise ProcessingError(f"JSON processing failed: {str(e)}")
+            label = _FORMAT_LABELS[fmt]
+            logger.error(f"Error processing {label.lower()} file {file_path}: {str(e)}")
+            raise ProcessingError(f"{label} processing failed: {str(e)}")
             
     async def _process_url(self, url: str) -> Dict:
         """Process web content using optimal scraping strategy"""
@@ -1,23 +1,124 @@
 from sentence_transformers import SentenceTransformer
-from typing import List
+from transformers import AutoTokenizer
+from typing import List, Optional
+from pathlib import Path
+import asyncio
 import numpy as np
+import onnxruntime as ort
+
+from ...utils.batching import RequestBatcher
 
 class EmbeddingGenerator:
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
-        self.model = SentenceTransformer(model_name)
-        self.dimension = self.model.get_sentence_embedding_dimension()
-        
-    def embed_query(self, text: str) -> List[float]:
+    """Sentence embeddings from MiniLM
+
+    If `onnx_dir` points at the output of scripts/export_onnx_embeddings.py,
+    the int8-quantized ONNX model is run with ONNX Runtime. Otherwise the
+    PyTorch SentenceTransformer model is loaded.
+    """
+
+    ONNX_MODEL_FILE = 'model_int8.onnx'
+
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        onnx_dir: Optional[str] = None
+    ):
+        if onnx_dir is not None:
+            onnx_path = Path(onnx_dir)
+            self.model = None
+            self.session = ort.InferenceSession(
+                str(onnx_path / self.ONNX_MODEL_FILE),
+                providers=['CPUExecutionProvider']
+            )
+            self.tokenizer = AutoTokenizer.from_pretrained(onnx_path)
+            self._input_names = {i.name for i in self.session.get_inputs()}
+            self.dimension = self.session.get_outputs()[0].shape[-1]
+        else:
+            self.model = SentenceTransformer(model_name)
+            self.session = None
+            self.dimension = self.model.get_sentence_embedding_dimension()
+
+    def embed_query(self, text: str) -> np.ndarray:
         """Generate embedding for a text query"""
-        return self.model.encode(text).tolist()
-    
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Batch generate embeddings"""
-        return self.model.encode(texts).tolist()
-    
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """Batch generate unit-length embeddings, one row per text"""
+        if self.session is not None:
+            if not texts:
+                return np.empty((0, self.dimension), dtype=np.float32)
+            return np.concatenate([
+                self._embed_onnx(texts[start:start + batch_size])
+                for start in range(0, len(texts), batch_size)
+            ])
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+
+    def _embed_onnx(self, texts: List[str]) -> np.ndarray:
+        """Run one padded batch through the ONNX model"""
+        tokens = self.tokenizer(
+            texts, padding=True, truncation=True, return_tensors='np'
+        )
+        inputs = {
+            name: value.astype(np.int64)
+            for name, value in tokens.items()
+            if name in self._input_names
+        }
+        hidden = self.session.run(None, inputs)[0]
+
+        # Mean-pool over real tokens, then L2-normalize, as the
+        # SentenceTransformer pipeline does
+        mask = tokens['attention_mask'][..., None].astype(hidden.dtype)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return self.normalize(pooled)
+
     @staticmethod
-    def normalize(vector: List[float]) -> List[float]:
-        """Normalize vector to unit length"""
-        arr = np.array(vector)
-        norm = np.linalg.norm(arr)
-        return (arr / norm).tolist() 
\ No newline at end of file
+    def normalize(vectors: np.ndarray) -> np.ndarray:
+        """Normalize vectors to unit length along the last axis, in place
+
+        Accepts a single vector or a 2D batch. Integer input is converted
+        to a new float array first.
+        """
+        vectors = np.asarray(vectors)
+        if not np.issubdtype(vectors.dtype, np.floating):
+            vectors = vectors.astype(np.float64)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        np.divide(vectors, norms, out=vectors)
+        return vectors
+
+class BatchedEmbedder:
+    """Coalesces concurrent embed_query calls into single encode calls
+
+    Queries arriving within `window` seconds of each other are encoded
+    together, up to `max_batch` per forward pass.
+    """
+
+    def __init__(
+        self,
+        generator: EmbeddingGenerator,
+        max_batch: int = 64,
+        window: float = 0.005
+    ):
+        self.generator = generator
+        self.max_batch = max_batch
+        self.window = window
+        self._batcher = RequestBatcher(self._embed, max_batch, window)
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        """Queue a query and wait for its embedding"""
+        return await self._batcher.submit(text)
+
+    async def aclose(self) -> None:
+        """Stop batching and fail any queries still waiting"""
+        await self._batcher.aclose()
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        """Encode one batch off the event loop"""
+        return await asyncio.to_thread(
+            self.generator.embed_batch, texts, self.max_batch
+        )
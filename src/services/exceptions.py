@@ -1,8 +1,23 @@
 """Custom exceptions for the chatbot application"""
 
 class ChatbotError(Exception):
-    """Base exception for all chatbot-related errors"""
-    pass
+    """Base exception for all chatbot-related errors
+    
+    Subclasses keep their extra attributes in __slots__, so raising them
+    doesn't allocate an instance dict.
+    """
+    __slots__ = ()
+    
+    def __reduce__(self):
+        # BaseException only pickles args and __dict__; carry the slot
+        # attributes too so errors survive crossing process boundaries
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, '__slots__', ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state or None
 
 class ServiceError(ChatbotError):
     """Base exception for service-related errors"""
@@ -38,18 +53,24 @@ class ThreadingError(ChatbotError):
 
 class ValidationError(ChatbotError):
     """Error related to data validation"""
+    __slots__ = ('field',)
+    
     def __init__(self, message: str, field: str = None):
         super().__init__(message)
         self.field = field
 
 class APIError(ServiceError):
     """Error related to external API calls"""
+    __slots__ = ('status_code',)
+    
     def __init__(self, message: str, status_code: int = None):
         super().__init__(message)
         self.status_code = status_code
 
 class RateLimitError(APIError):
     """Error related to API rate limiting"""
+    __slots__ = ('retry_after',)
+    
     def __init__(self, message: str, retry_after: int = None):
         super().__init__(message)
         self.retry_after = retry_after
@@ -60,12 +81,16 @@ class AuthenticationError(APIError):
 
 class ResourceNotFoundError(ServiceError):
     """Error when a requested resource is not found"""
+    __slots__ = ('resource_type',)
+    
     def __init__(self, message: str, resource_type: str = None):
         super().__init__(message)
         self.resource_type = resource_type
 
 class StateError(ChatbotError):
     """Error related to invalid state transitions"""
+    __slots__ = ('current_state', 'target_state')
+    
     def __init__(self, message: str, current_state: str = None, target_state: str = None):
         super().__init__(message)
         self.current_state = current_state
@@ -73,12 +98,16 @@ class StateError(ChatbotError):
 
 class MemoryError(ServiceError):
     """Error related to memory management"""
+    __slots__ = ('memory_type',)
+    
     def __init__(self, message: str, memory_type: str = None):
         super().__init__(message)
         self.memory_type = memory_type
 
 class PerformanceError(ServiceError):
     """Error related to performance issues"""
+    __slots__ = ('threshold', 'actual')
+    
     def __init__(self, message: str, threshold: float = None, actual: float = None):
         super().__init__(message)
         self.threshold = threshold
@@ -86,6 +115,8 @@ class PerformanceError(ServiceError):
 
 class SecurityError(ChatbotError):
     """Error related to security violations"""
+    __slots__ = ('violation_type',)
+    
     def __init__(self, message: str, violation_type: str = None):
         super().__init__(message)
         self.violation_type = violation_type
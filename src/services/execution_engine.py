@@ -1,7 +1,8 @@
 import platform
+import inspect
 import logging
 from typing import Optional, Dict, Any
-from .service_registry import ServiceRegistry
+from .service_registry import BaseService, ServiceRegistry
 from .visio.windows_visio_service import WindowsVisioService
 from .visio.mac_diagram_service import MacDiagramService
 
@@ -11,6 +12,10 @@ class ExecutionEngine:
     def __init__(self):
         self.os_type = platform.system()
         self.registry = ServiceRegistry()
+        # Visio instances keyed by OS type, reused so each diagram call
+        # doesn't launch Visio again. Browser-based services hold
+        # per-request state and are never cached.
+        self._visio_services: Dict[str, WindowsVisioService] = {}
         
     async def run_service(self, service_name: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
         try:
@@ -31,9 +36,29 @@ class ExecutionEngine:
     def _get_diagram_service(self) -> BaseService:
         """Get the appropriate diagram service for the current platform"""
         if self.os_type == "Windows":
+            service = self._visio_services.get(self.os_type)
+            if service is not None:
+                return service
             try:
-                return WindowsVisioService()
+                service = WindowsVisioService()
             except RuntimeError:
                 logger.warning("Falling back to browser-based diagram service on Windows")
                 return MacDiagramService()
-        return MacDiagramService() 
\ No newline at end of file
+            self._visio_services[self.os_type] = service
+            return service
+        return MacDiagramService()
+        
+    async def close(self) -> None:
+        """Clean up cached services that define a cleanup method"""
+        services, self._visio_services = self._visio_services, {}
+        for os_type, service in services.items():
+            cleanup = getattr(service, "cleanup", None)
+            if cleanup is None:
+                continue
+            try:
+                result = cleanup()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Failed to clean up diagram service for {os_type}: {str(e)}")
+ 
\ No newline at end of file
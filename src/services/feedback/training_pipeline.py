@@ -1,14 +1,17 @@
+from dataclasses import dataclass, field
 from datetime import datetime
-from pydantic import BaseModel
 import torch
 
-class FeedbackSample(BaseModel):
+@dataclass(slots=True)
+class FeedbackSample:
     original_diagram: dict
     user_modified: dict
     feedback_metrics: dict
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
 
 class FeedbackTrainer:
+    BATCH_SIZE = 16
+    
     def __init__(self, model):
         self.model = model
         self.feedback_queue = []
@@ -19,16 +22,40 @@ class FeedbackTrainer:
         
         if len(self.feedback_queue) >= 100:
             self.retrain_model()
-            
+        
     def retrain_model(self):
         """Fine-tune model with user feedback"""
         dataset = self._prepare_dataset()
-        trainer = torch.utils.data.DataLoader(dataset, batch_size=16)
         
-        # Fine-tuning logic
+        # Fine-tuning logic; the dataset is already one tensor on the
+        # model's device, so batches are views rather than DataLoader copies
         self.model.train()
         for epoch in range(3):
-            for batch in trainer:
+            for batch in dataset.split(self.BATCH_SIZE):
                 self.model.update(batch)
-                
-        torch.save(self.model.state_dict(), "retrained_model.pth") 
\ No newline at end of file
+        
+        torch.save(self.model.state_dict(), "retrained_model.pth")
+        # Only drop the samples once the retrained model is saved, so a
+        # failed run keeps them for the next attempt
+        self.feedback_queue = []
+        
+    def _prepare_dataset(self) -> torch.Tensor:
+        """Stack the queued feedback metrics into one (N, M) tensor
+        
+        Columns follow the sorted metric names of the first sample. The
+        tensor is copied to the model's device once, from pinned memory
+        when that device is a GPU.
+        """
+        metric_names = sorted(self.feedback_queue[0].feedback_metrics)
+        dataset = torch.tensor(
+            [
+                [float(sample.feedback_metrics.get(name, 0.0)) for name in metric_names]
+                for sample in self.feedback_queue
+            ],
+            dtype=torch.float32
+        )
+        
+        device = next(self.model.parameters(), dataset).device
+        if device.type == "cuda":
+            dataset = dataset.pin_memory()
+        return dataset.to(device, non_blocking=True)
\ No newline at end of file
@@ -1,15 +1,31 @@
 import logging
+import os
 from pathlib import Path
 import shutil
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, List, Set
 import json
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import asyncio
-import aiofiles
-from .file_validator_service import FileValidator
+from .file_validator_service import FileValidator, FileValidationResult, MIME_HEADER_SIZE
+from ..utils.file_copy import copy_and_hash
 
 logger = logging.getLogger(__name__)
 
+NS_PER_SECOND = 1_000_000_000
+
+def _to_ns(timestamp) -> int:
+    """Convert a stored timestamp to integer nanoseconds since the epoch
+    
+    Metadata written before timestamps were stored as integers holds ISO
+    strings instead.
+    """
+    if isinstance(timestamp, str):
+        return int(datetime.fromisoformat(timestamp).timestamp() * NS_PER_SECOND)
+    return timestamp
+
 class FileCacheService:
     """Service for caching frequently downloaded files"""
     
@@ -34,7 +50,12 @@ class FileCacheService:
         self.cache_ttl = cache_ttl
         self.cleanup_interval = cleanup_interval
         self.metadata_file = self.cache_dir / "metadata.json"
+        self.journal_file = self.cache_dir / "metadata.log"
         self.file_validator = FileValidator()
+        # Serializes snapshot writes; _metadata_dirty lets callers queued
+        # behind a write skip their own if it already covered their change
+        self._save_lock = asyncio.Lock()
+        self._metadata_dirty = False
         
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -43,25 +64,178 @@ class FileCacheService:
         self._init_metadata()
         
         # Start cleanup task
-        asyncio.create_task(self._cleanup_loop())
+        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+    
+    async def close(self) -> None:
+        """Stop the cleanup task and close the access journal"""
+        self._cleanup_task.cancel()
+        try:
+            await self._cleanup_task
+        except asyncio.CancelledError:
+            pass
+        self._journal_fh.close()
     
     def _init_metadata(self) -> None:
-        """Initialize or load cache metadata"""
+        """Initialize or load cache metadata
+        
+        The snapshot in metadata.json is brought up to date by replaying
+        the access journal written since it was taken. Files are kept in
+        an OrderedDict from least to most recently used, so eviction never
+        has to sort them.
+        """
+        self._journal_fh = None
         if self.metadata_file.exists():
             with open(self.metadata_file, "r") as f:
                 self.metadata = json.load(f)
+            self.metadata.setdefault("urls", {})
+            for cache_info in self.metadata["files"].values():
+                self._migrate_timestamps(cache_info)
+            # Snapshots are written in LRU order, but older ones may not be
+            self.metadata["files"] = OrderedDict(sorted(
+                self.metadata["files"].items(),
+                key=lambda item: item[1]["last_accessed_ns"]
+            ))
+            self._replay_journal()
         else:
             self.metadata = {
-                "files": {},
+                "files": OrderedDict(),
+                "urls": {},
                 "total_size": 0,
                 "last_cleanup": datetime.now().isoformat()
             }
-            self._save_metadata()
+        self._journal_fh = open(self.journal_file, "ab", buffering=0)
+        self._save_metadata()
+    
+    @staticmethod
+    def _migrate_timestamps(cache_info: Dict) -> None:
+        """Replace ISO timestamp fields with integer nanosecond ones"""
+        for name in ("cached_at", "last_accessed"):
+            if name in cache_info:
+                cache_info[f"{name}_ns"] = _to_ns(cache_info.pop(name))
+    
+    def _is_fresh(self, cache_info: Dict) -> bool:
+        """Whether a file is still within its TTL"""
+        age_ns = time.time_ns() - cache_info["cached_at_ns"]
+        return age_ns < self.cache_ttl * NS_PER_SECOND
+    
+    def _replay_journal(self) -> None:
+        """Apply journaled access updates to the loaded snapshot"""
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, "rb") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Partial last line from an interrupted write
+                    continue
+                cache_info = self.metadata["files"].get(entry["h"])
+                if cache_info is None:
+                    continue
+                cache_info["last_accessed_ns"] = _to_ns(entry["t"])
+                cache_info["access_count"] = entry["c"]
+                if "a" in entry:
+                    cache_info["cached_at_ns"] = _to_ns(entry["a"])
+                self.metadata["files"].move_to_end(entry["h"])
     
     def _save_metadata(self) -> None:
-        """Save cache metadata to file"""
-        with open(self.metadata_file, "w") as f:
-            json.dump(self.metadata, f, indent=2)
+        """Write a full metadata snapshot and clear the access journal
+        
+        Blocking; only used at startup; use _save_metadata_async otherwise.
+        """
+        self._write_metadata_sync(json.dumps(self.metadata, indent=2))
+        self._metadata_dirty = False
+        if self._journal_fh is not None:
+            self._journal_fh.truncate(0)
+    
+    async def _save_metadata_async(self) -> None:
+        """Write a metadata snapshot in a worker thread if anything changed
+        
+        The metadata is serialized on the event loop, since it may change
+        while the worker thread writes it out. Access updates journaled
+        after that point and then truncated away are still in memory, and
+        so in the next snapshot.
+        """
+        async with self._save_lock:
+            if not self._metadata_dirty:
+                return
+            self._metadata_dirty = False
+            data = json.dumps(self.metadata, indent=2)
+            try:
+                await asyncio.to_thread(self._write_metadata_sync, data)
+            except Exception:
+                self._metadata_dirty = True
+                raise
+            self._journal_fh.truncate(0)
+    
+    def _write_metadata_sync(self, data: str) -> None:
+        """Atomically replace metadata.json with serialized metadata
+        
+        The snapshot is written to a temporary file, synced to disk and
+        renamed over the old one, so a crash never leaves a truncated
+        metadata.json. The rename itself is synced too, since callers
+        truncate the journal as soon as this returns.
+        """
+        tmp_file = self.metadata_file.with_name(self.metadata_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.metadata_file)
+        self._fsync_dir()
+    
+    def _fsync_dir(self) -> None:
+        """Sync the cache directory entry, where the platform allows it"""
+        try:
+            dir_fd = os.open(self.cache_dir, os.O_RDONLY)
+        except OSError:
+            # Directories can't be opened for syncing on Windows
+            return
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    def _journal_entry(
+        self,
+        file_hash: str,
+        cache_info: Dict,
+        cached_at: bool = False
+    ) -> bytes:
+        """Encode an access update as one journal line
+        
+        Entries hold absolute values rather than increments, so replaying
+        one that is already part of the snapshot is harmless.
+        """
+        entry = {
+            "h": file_hash,
+            "t": cache_info["last_accessed_ns"],
+            "c": cache_info["access_count"]
+        }
+        if cached_at:
+            entry["a"] = cache_info["cached_at_ns"]
+        return json.dumps(entry).encode() + b"\n"
+    
+    async def _record_access(
+        self,
+        file_hash: str,
+        cache_info: Dict,
+        cached_at: bool = False
+    ) -> None:
+        """Update a file's access time and count and journal the change
+        
+        With cached_at, the file's TTL is restarted as well.
+        """
+        now = time.time_ns()
+        if cached_at:
+            cache_info["cached_at_ns"] = now
+        cache_info["last_accessed_ns"] = now
+        cache_info["access_count"] += 1
+        self.metadata["files"].move_to_end(file_hash)
+        await asyncio.to_thread(
+            self._journal_fh.write,
+            self._journal_entry(file_hash, cache_info, cached_at=cached_at)
+        )
     
     async def get_cached_file(self, file_path: Path) -> Optional[Path]:
         """
@@ -75,8 +249,10 @@ class FileCacheService:
         """
         try:
             # Validate original file
+            # Validation results are cached per (path, mtime, size), so
+            # repeated lookups of an unchanged file skip rehashing it
             validation = self.file_validator.validate_file(file_path)
-            file_hash = validation["hash"]
+            file_hash = validation.content_id
             
             # Check if file is in cache
             if file_hash in self.metadata["files"]:
@@ -84,12 +260,8 @@ class FileCacheService:
                 cached_path = self.cache_dir / file_hash
                 
                 # Check if cache is still valid
-                cache_time = datetime.fromisoformat(cache_info["cached_at"])
-                if (datetime.now() - cache_time).total_seconds() < self.cache_ttl:
-                    # Update access time
-                    cache_info["last_accessed"] = datetime.now().isoformat()
-                    cache_info["access_count"] += 1
-                    self._save_metadata()
+                if self._is_fresh(cache_info):
+                    await self._record_access(file_hash, cache_info)
                     
                     return cached_path
             
@@ -99,56 +271,238 @@ class FileCacheService:
             logger.error(f"Error getting cached file: {str(e)}")
             return None
     
-    async def cache_file(self, file_path: Path) -> Optional[Path]:
+    async def get_cached_url(self, url: str) -> Optional[Path]:
+        """
+        Get a previously downloaded file from cache by its source URL
+        
+        Unlike get_cached_file this never touches the original file, so a
+        hit costs a dictionary lookup rather than a validation pass.
+        
+        Args:
+            url: URL the file was downloaded from
+        
+        Returns:
+            Path to cached file if available, None otherwise
+        """
+        file_hash = self.metadata["urls"].get(url)
+        if file_hash is None:
+            return None
+        
+        cache_info = self.metadata["files"].get(file_hash)
+        if cache_info is None:
+            # Entry was evicted; drop the stale URL mapping
+            del self.metadata["urls"][url]
+            self._metadata_dirty = True
+            return None
+        
+        if not self._is_fresh(cache_info):
+            return None
+        
+        await self._record_access(file_hash, cache_info)
+        
+        return self.cache_dir / file_hash
+    
+    def get_cached_metadata(self, url: str) -> Optional[Dict]:
+        """
+        Get cache metadata for a URL's file, even if its TTL has lapsed
+        
+        Used to revalidate an entry with a conditional request instead of
+        downloading it again.
+        
+        Args:
+            url: URL the file was downloaded from
+        
+        Returns:
+            Copy of the file's metadata, including etag/last_modified when
+            the server sent them, or None if the file is no longer cached
+        """
+        file_hash = self.metadata["urls"].get(url)
+        if file_hash is None or file_hash not in self.metadata["files"]:
+            return None
+        return dict(self.metadata["files"][file_hash])
+    
+    async def refresh_cached_url(self, url: str) -> Optional[Path]:
+        """
+        Restart the TTL of a URL's file after the server confirmed it is
+        unchanged (HTTP 304)
+        
+        Args:
+            url: URL the file was downloaded from
+        
+        Returns:
+            Path to cached file if still cached, None otherwise
+        """
+        file_hash = self.metadata["urls"].get(url)
+        cache_info = self.metadata["files"].get(file_hash)
+        if cache_info is None or not (self.cache_dir / file_hash).exists():
+            return None
+        
+        await self._record_access(file_hash, cache_info, cached_at=True)
+        
+        return self.cache_dir / file_hash
+    
+    async def cache_file(
+        self,
+        file_path: Path,
+        source_url: Optional[str] = None
+    ) -> Optional[Path]:
         """
         Cache a file for future use
         
         Args:
             file_path: File to cache
+            source_url: Optional URL the file was downloaded from, used to
+                serve later lookups through get_cached_url
         
         Returns:
             Path to cached file if successful, None otherwise
         """
+        temp_path = self.cache_dir / f".{uuid.uuid4().hex}.part"
         try:
-            # Validate file
-            validation = self.file_validator.validate_file(file_path)
-            file_hash = validation["hash"]
-            file_size = validation["size"]
+            # Read the file once: copy it under a temporary name while
+            # hashing it, since the cached name is its content ID
+            file_hash, file_size, header = await asyncio.to_thread(
+                copy_and_hash,
+                file_path,
+                temp_path,
+                self.file_validator.new_content_hasher(),
+                header_size=MIME_HEADER_SIZE
+            )
+            mime_type = self.file_validator.mime.from_buffer(header)
             
             # Check if we need to make space
             if self.metadata["total_size"] + file_size > self.max_cache_size:
                 await self._make_space(file_size)
             
-            # Copy file to cache
             cached_path = self.cache_dir / file_hash
-            await self._copy_file(file_path, cached_path)
+            previous = self.metadata["files"].get(file_hash)
+            os.replace(temp_path, cached_path)
+            if previous:
+                self.metadata["total_size"] -= previous["size"]
             
-            # Update metadata
-            self.metadata["files"][file_hash] = {
-                "original_path": str(file_path),
-                "size": file_size,
-                "mime_type": validation["mime_type"],
-                "cached_at": datetime.now().isoformat(),
-                "last_accessed": datetime.now().isoformat(),
-                "access_count": 1
-            }
-            self.metadata["total_size"] += file_size
-            self._save_metadata()
+            self._register_file(
+                file_hash,
+                file_size,
+                mime_type,
+                file_path,
+                source_url
+            )
+            await self._save_metadata_async()
             
             return cached_path
             
         except Exception as e:
+            temp_path.unlink(missing_ok=True)
             logger.error(f"Error caching file: {str(e)}")
             return None
     
-    async def _copy_file(self, src: Path, dst: Path) -> None:
-        """Copy file using async IO"""
-        async with aiofiles.open(src, "rb") as fsrc:
-            async with aiofiles.open(dst, "wb") as fdst:
-                chunk = await fsrc.read(8192)
-                while chunk:
-                    await fdst.write(chunk)
-                    chunk = await fsrc.read(8192)
+    def reserve_path(self, key: str) -> Path:
+        """
+        Get a staging path inside the cache directory
+        
+        Files written here live on the same filesystem as the cache, so
+        commit_file can promote them with a rename instead of a copy.
+        
+        Args:
+            key: Caller-chosen unique key, e.g. a hash of the source URL
+        
+        Returns:
+            Path to write the file to before committing it
+        """
+        return self.cache_dir / f"{key}.part"
+    
+    async def commit_file(
+        self,
+        staged_path: Path,
+        validation: FileValidationResult,
+        source_url: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Move an already validated file from reserve_path into the cache
+        
+        Args:
+            staged_path: Path previously returned by reserve_path
+            validation: Validation result for the staged file; its
+                content_id is the cache key, and is computed here if the
+                validation didn't produce one
+            source_url: Optional URL the file was downloaded from
+            etag: Optional ETag header returned with the download
+            last_modified: Optional Last-Modified header returned with
+                the download
+        
+        Returns:
+            Path to cached file if successful, None otherwise
+        """
+        try:
+            # Keyed by content ID like cache_file, so the same bytes share
+            # one entry however they were cached
+            file_hash = validation.content_id
+            if file_hash is None:
+                file_hash = await asyncio.to_thread(
+                    self.file_validator._calculate_content_id, staged_path
+                )
+            file_size = validation.size
+            
+            # Check if we need to make space
+            if self.metadata["total_size"] + file_size > self.max_cache_size:
+                await self._make_space(file_size)
+            
+            # Atomic rename; replaces any existing copy of the same content
+            cached_path = self.cache_dir / file_hash
+            previous = self.metadata["files"].get(file_hash)
+            os.replace(staged_path, cached_path)
+            if previous:
+                self.metadata["total_size"] -= previous["size"]
+            
+            self._register_file(
+                file_hash,
+                validation.size,
+                validation.mime_type,
+                staged_path,
+                source_url,
+                etag=etag,
+                last_modified=last_modified
+            )
+            await self._save_metadata_async()
+            
+            return cached_path
+            
+        except Exception as e:
+            logger.error(f"Error committing cached file: {str(e)}")
+            return None
+    
+    def _register_file(
+        self,
+        file_hash: str,
+        size: int,
+        mime_type: Optional[str],
+        original_path: Path,
+        source_url: Optional[str],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Record a newly cached file in the metadata"""
+        now = time.time_ns()
+        self.metadata["files"][file_hash] = {
+            "original_path": str(original_path),
+            "size": size,
+            "mime_type": mime_type,
+            "cached_at_ns": now,
+            "last_accessed_ns": now,
+            "access_count": 1
+        }
+        # Replacing an existing entry also makes it most recently used
+        self.metadata["files"].move_to_end(file_hash)
+        if etag:
+            self.metadata["files"][file_hash]["etag"] = etag
+        if last_modified:
+            self.metadata["files"][file_hash]["last_modified"] = last_modified
+        self.metadata["total_size"] += size
+        if source_url:
+            self.metadata["urls"][source_url] = file_hash
+        self._metadata_dirty = True
     
     async def _make_space(self, needed_size: int) -> None:
         """
@@ -157,53 +511,76 @@ class FileCacheService:
         Args:
             needed_size: Size needed in bytes
         """
-        # Sort files by last access time and access count
-        sorted_files = sorted(
-            self.metadata["files"].items(),
-            key=lambda x: (
-                datetime.fromisoformat(x[1]["last_accessed"]),
-                x[1]["access_count"]
-            )
-        )
+        # Take least recently used files out of the metadata until there
+        # is enough space, so lookups miss them while they are deleted
+        files = self.metadata["files"]
+        victims = {}
+        freed = 0
+        while files and self.metadata["total_size"] - freed + needed_size > self.max_cache_size:
+            file_hash, info = files.popitem(last=False)
+            victims[file_hash] = info
+            freed += info["size"]
         
-        # Remove files until we have enough space
-        for file_hash, info in sorted_files:
-            if self.metadata["total_size"] + needed_size <= self.max_cache_size:
-                break
-                
-            cached_path = self.cache_dir / file_hash
-            try:
-                cached_path.unlink()
+        await self._remove_files(victims)
+    
+    async def _remove_files(self, entries: Dict[str, Dict]) -> None:
+        """Delete files already taken out of the metadata
+        
+        The unlinks run as one batch in a worker thread. Files that could
+        not be deleted are put back as most recently used, so they are not
+        retried first.
+        """
+        if not entries:
+            return
+        removed = await asyncio.to_thread(self._bulk_unlink, list(entries))
+        for file_hash, info in entries.items():
+            if file_hash in removed:
                 self.metadata["total_size"] -= info["size"]
-                del self.metadata["files"][file_hash]
-            except Exception as e:
+            else:
+                self.metadata["files"][file_hash] = info
+        self._metadata_dirty = True
+    
+    def _bulk_unlink(self, file_hashes: List[str]) -> Set[str]:
+        """Delete cached files, returning the hashes that are gone"""
+        removed = set()
+        for file_hash in file_hashes:
+            try:
+                (self.cache_dir / file_hash).unlink(missing_ok=True)
+                removed.add(file_hash)
+            except OSError as e:
                 logger.error(f"Error removing cached file: {str(e)}")
+        return removed
+    
+    async def _cleanup_expired(self) -> None:
+        """Delete files whose TTL has lapsed
+        
+        Files with an ETag or Last-Modified validator are kept past their
+        TTL, so download_file can revalidate them with a conditional
+        request; they leave the cache through LRU eviction in _make_space.
+        """
+        now = datetime.now()
+        cutoff = time.time_ns() - self.cache_ttl * NS_PER_SECOND
+        files = self.metadata["files"]
+        expired_hashes = [
+            h for h, info in files.items()
+            if info["cached_at_ns"] < cutoff
+            and "etag" not in info
+            and "last_modified" not in info
+        ]
+        await self._remove_files(
+            {h: files.pop(h) for h in expired_hashes}
+        )
+        
+        self.metadata["last_cleanup"] = now.isoformat()
+        self._metadata_dirty = True
+        await self._save_metadata_async()
     
     async def _cleanup_loop(self) -> None:
         """Background task for cache cleanup"""
         while True:
             try:
-                # Remove expired files
-                now = datetime.now()
-                expired_hashes = [
-                    h for h, info in self.metadata["files"].items()
-                    if (now - datetime.fromisoformat(info["cached_at"])).total_seconds() > self.cache_ttl
-                ]
-                
-                for file_hash in expired_hashes:
-                    cached_path = self.cache_dir / file_hash
-                    info = self.metadata["files"][file_hash]
-                    try:
-                        cached_path.unlink()
-                        self.metadata["total_size"] -= info["size"]
-                        del self.metadata["files"][file_hash]
-                    except Exception as e:
-                        logger.error(f"Error cleaning up cached file: {str(e)}")
-                
-                self.metadata["last_cleanup"] = now.isoformat()
-                self._save_metadata()
-                
+                await self._cleanup_expired()
             except Exception as e:
                 logger.error(f"Error in cache cleanup: {str(e)}")
             
-            await asyncio.sleep(self.cleanup_interval) 
\ No newline at end of file
+            await asyncio.sleep(self.cleanup_interval)
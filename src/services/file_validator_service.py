@@ -2,16 +2,27 @@ from enum import Enum
 from pathlib import Path
 import magic
 import logging
-from typing import Set, Optional, Dict, List
+from typing import Set, Optional, Dict, List, Literal
 import mimetypes
 import hashlib
+import blake3
 from datetime import datetime, timedelta
 import os
+import mmap
 import re
+from collections import OrderedDict
 from pydantic import BaseModel, Field, validator
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the start of a file for MIME detection
+MIME_HEADER_SIZE = 4096
+
+# Loading the magic database is the expensive part of magic.Magic, so all
+# validators share one instance. Sharing it across threads is safe because
+# python-magic serializes every call with an internal lock.
+_MAGIC = magic.Magic(mime=True)
+
 class FileCategory(str, Enum):
     """Categories of supported files"""
     DOCUMENT = "document"
@@ -25,6 +36,10 @@ class FileValidationResult(BaseModel):
     mime_type: Optional[str] = Field(None, description="Detected MIME type")
     size: int = Field(..., description="File size in bytes")
     hash: str = Field(..., description="SHA-256 hash of file")
+    content_id: Optional[str] = Field(
+        None,
+        description="Content hash used as a cache key, in the validator's content_id_algo"
+    )
     validation_time: datetime = Field(default_factory=datetime.now)
     errors: List[str] = Field(default_factory=list)
     
@@ -40,10 +55,11 @@ class FileValidationResult(BaseModel):
             raise ValueError("File size cannot be negative")
         return v
     
-    @validator("hash")
+    @validator("hash", "content_id")
     def validate_hash(cls, v):
-        if not re.match(r"^[a-fA-F0-9]{64}$", v):
-            raise ValueError("Invalid SHA-256 hash format")
+        # SHA-256 and 32-byte BLAKE3 digests are both 64 hex characters
+        if v is not None and not re.match(r"^[a-fA-F0-9]{64}$", v):
+            raise ValueError("Invalid hash format")
         return v
 
 class FileValidator:
@@ -69,34 +85,67 @@ class FileValidator:
         }
     }
     
+    # Reverse lookup of ALLOWED_TYPES
+    _MIME_TO_CATEGORY: Dict[str, FileCategory] = {
+        mime_type: category
+        for category, mime_types in ALLOWED_TYPES.items()
+        for mime_type in mime_types
+    }
+    
+    # Number of validation results kept for unchanged files
+    VALIDATION_CACHE_SIZE = 4096
+    
     def __init__(
         self,
         max_file_size: int = 10 * 1024 * 1024,  # 10MB default
-        allowed_extensions: Optional[Set[str]] = None
+        allowed_extensions: Optional[Set[str]] = None,
+        content_id_algo: Literal["sha256", "blake3"] = "blake3"
     ):
         """Initialize the validator
         
         Args:
             max_file_size: Maximum allowed file size in bytes
             allowed_extensions: Optional set of allowed file extensions
+            content_id_algo: Hash used for content IDs (cache keys). These
+                only need to be collision resistant, so the faster BLAKE3
+                is the default
         """
         if max_file_size <= 0:
             raise ValueError("max_file_size must be positive")
+        if content_id_algo not in ("sha256", "blake3"):
+            raise ValueError(f"Unsupported content_id_algo: {content_id_algo}")
             
         self.max_file_size = max_file_size
         self.allowed_extensions = allowed_extensions
-        self.mime = magic.Magic(mime=True)
+        self.content_id_algo = content_id_algo
+        self.mime = _MAGIC
+        # Results keyed by (path, mtime, size, allowed categories), so a
+        # file is only hashed again once it changes
+        self._vcache: OrderedDict[tuple, FileValidationResult] = OrderedDict()
     
     def validate_file(
         self,
         file_path: Path,
-        allowed_categories: Optional[Set[FileCategory]] = None
+        allowed_categories: Optional[Set[FileCategory]] = None,
+        precomputed_hash: Optional[str] = None,
+        precomputed_size: Optional[int] = None,
+        compute_hash: bool = True,
+        precomputed_content_id: Optional[str] = None
     ) -> FileValidationResult:
         """Validate a file against security and type constraints
         
         Args:
             file_path: Path to file to validate
             allowed_categories: Optional set of allowed categories
+            precomputed_hash: SHA-256 hex digest already computed by the
+                caller (e.g. while streaming the file); skips re-reading it
+            precomputed_size: File size already known to the caller;
+                skips the stat call
+            compute_hash: If False, validate from metadata only and leave
+                the hash as all zeros, for callers that hash the file
+                themselves
+            precomputed_content_id: Content ID (see new_content_hasher)
+                computed alongside precomputed_hash
             
         Returns:
             Validation result with metadata
@@ -109,10 +158,30 @@ class FileValidator:
         # Basic path validation
         if not isinstance(file_path, Path):
             file_path = Path(file_path)
+        
+        # Reuse the result for an unchanged file; only full validations
+        # are cached, since the other modes are cheap
+        cache_key = None
+        if compute_hash and precomputed_hash is None:
+            try:
+                st = file_path.stat()
+            except OSError:
+                pass  # Reported by the checks below
+            else:
+                cache_key = (
+                    str(file_path),
+                    st.st_mtime_ns,
+                    st.st_size,
+                    frozenset(allowed_categories or ())
+                )
+                cached = self._vcache.get(cache_key)
+                if cached is not None:
+                    self._vcache.move_to_end(cache_key)
+                    return cached
             
         if not file_path.exists():
             errors.append("File does not exist")
-            return FileValidationResult(
+            return FileValidationResult.model_construct(
                 is_valid=False,
                 size=0,
                 hash="0" * 64,
@@ -121,7 +190,7 @@ class FileValidator:
             
         if not file_path.is_file():
             errors.append("Path is not a regular file")
-            return FileValidationResult(
+            return FileValidationResult.model_construct(
                 is_valid=False,
                 size=0,
                 hash="0" * 64,
@@ -130,7 +199,10 @@ class FileValidator:
         
         # Size validation
         try:
-            size = file_path.stat().st_size
+            if precomputed_size is not None:
+                size = precomputed_size
+            else:
+                size = file_path.stat().st_size
             if size > self.max_file_size:
                 errors.append(f"File size exceeds limit of {self.max_file_size} bytes")
         except OSError as e:
@@ -142,43 +214,65 @@ class FileValidator:
             if file_path.suffix.lower() not in self.allowed_extensions:
                 errors.append("File extension not allowed")
         
-        # Calculate file hash
+        # Read the MIME header, then calculate the file hash and content
+        # ID, through a single open file
+        header = None
+        content_id = precomputed_content_id
+        if precomputed_hash is not None:
+            file_hash = precomputed_hash
+        else:
+            file_hash = "0" * 64
         try:
             with open(file_path, "rb") as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-        except Exception as e:
-            errors.append(f"Error calculating file hash: {str(e)}")
-            file_hash = "0" * 64
+                header = f.read(MIME_HEADER_SIZE)
+                if precomputed_hash is None and compute_hash:
+                    try:
+                        file_hash = self._hash_open_file(f)
+                        if self.content_id_algo == "sha256":
+                            content_id = file_hash
+                        else:
+                            content_id = self._content_id_open_file(f)
+                    except Exception as e:
+                        errors.append(f"Error calculating file hash: {str(e)}")
+                        file_hash = "0" * 64
+                        content_id = None
+        except OSError as e:
+            errors.append(f"Error reading file: {str(e)}")
         
         # MIME type detection
-        try:
-            mime_type = self.mime.from_file(str(file_path))
-        except Exception as e:
-            errors.append(f"Error detecting MIME type: {str(e)}")
-            mime_type = None
+        mime_type = None
+        if header is not None:
+            try:
+                mime_type = self.mime.from_buffer(header)
+            except Exception as e:
+                errors.append(f"Error detecting MIME type: {str(e)}")
         
         # Category validation
         category = None
         if mime_type:
-            for cat, allowed_types in self.ALLOWED_TYPES.items():
-                if mime_type in allowed_types:
-                    category = cat
-                    break
-            
+            category = self._get_file_category(mime_type)
             if category is None:
                 errors.append(f"Unsupported MIME type: {mime_type}")
             elif allowed_categories and category not in allowed_categories:
                 errors.append(f"File category {category} not allowed")
         
         # Create validation result
-        return FileValidationResult(
+        # Every field is produced above in its final form, so skip
+        # pydantic's validators
+        result = FileValidationResult.model_construct(
             is_valid=len(errors) == 0,
             category=category,
             mime_type=mime_type,
             size=size,
             hash=file_hash,
+            content_id=content_id,
             errors=errors
         )
+        if cache_key is not None:
+            self._vcache[cache_key] = result
+            if len(self._vcache) > self.VALIDATION_CACHE_SIZE:
+                self._vcache.popitem(last=False)
+        return result
     
     def get_safe_filename(self, filename: str) -> str:
         """Generate a safe version of a filename
@@ -200,18 +294,52 @@ class FileValidator:
     
     def _get_file_category(self, mime_type: str) -> Optional[FileCategory]:
         """Determine file category from MIME type"""
-        for category, mime_types in self.ALLOWED_TYPES.items():
-            if mime_type in mime_types:
-                return category
-        return None
+        return self._MIME_TO_CATEGORY.get(mime_type)
     
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA-256 hash of file content"""
-        sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            return self._hash_open_file(f)
+    
+    def _calculate_content_id(self, file_path: Path) -> str:
+        """Calculate the content ID of a file"""
+        with open(file_path, "rb") as f:
+            return self._content_id_open_file(f)
+    
+    def _hash_open_file(self, f) -> str:
+        """Calculate SHA-256 hash of an open binary file from its start
+        
+        hashlib.file_digest (Python 3.11+) reads the file and hashes it in
+        C without holding the GIL. Older versions hash a memory map of the
+        file in one update call instead of looping over small blocks.
+        """
+        f.seek(0)
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()  # Empty files can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+    
+    def _content_id_open_file(self, f) -> str:
+        """Calculate the content ID of an open binary file
+        
+        BLAKE3 hashes a memory map of the file, using several threads for
+        large files.
+        """
+        if self.content_id_algo == "sha256":
+            return self._hash_open_file(f)
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        return hasher.hexdigest()
+    
+    def new_content_hasher(self):
+        """Get an empty hash object for computing content IDs incrementally"""
+        if self.content_id_algo == "sha256":
+            return hashlib.sha256()
+        return blake3.blake3()
     
     @staticmethod
     def get_extension(mime_type: str) -> str:
@@ -623,26 +623,18 @@ class ScreenshotAnalysisService:
             if not horizontal_lines or not vertical_lines:
                 return 0.0
             
-            # Calculate line spacing consistency
-            h_spacing = []
-            for i in range(1, len(horizontal_lines)):
-                h_spacing.append(
-                    horizontal_lines[i][1] - horizontal_lines[i-1][1]
-                )
-            
-            v_spacing = []
-            for i in range(1, len(vertical_lines)):
-                v_spacing.append(
-                    vertical_lines[i][0] - vertical_lines[i-1][0]
-                )
+            # Calculate line spacing consistency (y of horizontal lines,
+            # x of vertical lines)
+            h_spacing = np.diff(np.asarray(horizontal_lines, dtype=np.float64)[:, 1])
+            v_spacing = np.diff(np.asarray(vertical_lines, dtype=np.float64)[:, 0])
             
             # Calculate variance in spacing
-            h_variance = np.var(h_spacing) if h_spacing else float('inf')
-            v_variance = np.var(v_spacing) if v_spacing else float('inf')
+            h_variance = h_spacing.var() if h_spacing.size else float('inf')
+            v_variance = v_spacing.var() if v_spacing.size else float('inf')
             
             # Calculate coverage
-            h_coverage = len(horizontal_lines) * np.mean(h_spacing) / height if h_spacing else 0
-            v_coverage = len(vertical_lines) * np.mean(v_spacing) / width if v_spacing else 0
+            h_coverage = len(horizontal_lines) * h_spacing.mean() / height if h_spacing.size else 0
+            v_coverage = len(vertical_lines) * v_spacing.mean() / width if v_spacing.size else 0
             
             # Combine metrics
             spacing_score = 1.0 / (1.0 + h_variance + v_variance)
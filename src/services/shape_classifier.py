@@ -4,6 +4,7 @@ from torchvision import models
 from torch.utils.data import Dataset, DataLoader
 from sklearn.metrics import classification_report
 from typing import List, Dict, Tuple
+import asyncio
 import json
 from pathlib import Path
 
@@ -94,6 +95,45 @@ class ShapeClassifierService:
             "confidence": torch.softmax(output, dim=1)[0][class_id].item()
         }
         
+    async def classify_shape_batch(
+        self,
+        images: List,
+        batch_size: int = 32
+    ) -> List[Dict]:
+        """Classify several Visio shapes with batched inference
+        
+        Images are stacked into tensors of up to batch_size and run through
+        the model in one forward pass per batch, off the event loop.
+        """
+        if not self.model:
+            raise ValueError("Model not loaded or trained")
+        if not images:
+            return []
+        return await asyncio.to_thread(self._classify_batches, images, batch_size)
+    
+    def _classify_batches(self, images: List, batch_size: int) -> List[Dict]:
+        """Run batched inference over images, batch_size at a time"""
+        self.model.eval()
+        results = []
+        with torch.no_grad():
+            for start in range(0, len(images), batch_size):
+                batch = torch.stack([
+                    self.transform(image)
+                    for image in images[start:start + batch_size]
+                ]).to(self.device)
+                probabilities = torch.softmax(self.model(batch), dim=1)
+                confidences, predicted = torch.max(probabilities, 1)
+                for class_id, confidence in zip(
+                    predicted.tolist(),
+                    confidences.tolist()
+                ):
+                    results.append({
+                        "class_id": class_id,
+                        "class_name": self.reverse_label_map[class_id],
+                        "confidence": confidence
+                    })
+        return results
+    
     def save_model(self, model_path: Path):
         """Save the trained model"""
         torch.save({
@@ -1244,15 +1244,4 @@ class VisioGenerator:
     async def _detect_components(self):
         # Implementation of _detect_components method
         pass
-
-    def _add_spec_content(self, diagram, specs):
-        # Implementation of _add_spec_content method
-        pass
-
-    def _finalize_diagram(self, diagram):
-        # Implementation of _finalize_diagram method
-        pass
-
-    async def _detect_components(self):
-        # Implementation of _detect_components method
-        pass 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""Coalescing of concurrent requests into batches"""
+
+import asyncio
+import contextlib
+from typing import Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from ..services.exceptions import ServiceError
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+class RequestBatcher(Generic[T, R]):
+    """Collects items submitted around the same time into one handler call
+
+    Items arriving within `window` seconds of each other are passed to
+    `handler` together, up to `max_batch` at a time. The handler returns
+    one result per item, in order.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch: int,
+        window: float
+    ):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[Tuple[T, asyncio.Future]] = []
+        self._closed = False
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result"""
+        if self._closed:
+            raise ServiceError("Batcher is closed")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop batching and fail every request still waiting for a result"""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        pending = self._batch
+        self._batch = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        error = ServiceError("Batcher closed before the request completed")
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _drain(self) -> None:
+        """Run queued items through the handler in batches until the queue is empty"""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            # Kept on the instance so aclose() can fail an in-flight batch
+            self._batch = batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await self.handler([item for item, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            self._batch = []
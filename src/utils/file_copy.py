@@ -0,0 +1,48 @@
+"""Single-pass file copying"""
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+from ..services.exceptions import ValidationError
+
+COPY_BLOCK_SIZE = 1024 * 1024  # 1MB
+
+def copy_and_hash(
+    src: Path,
+    dst: Path,
+    hasher,
+    max_size: Optional[int] = None,
+    header_size: int = 0
+) -> Tuple[str, int, bytes]:
+    """Copy src to dst, hashing each block as it is written
+
+    Blocking; run it in a worker thread from async code.
+
+    Args:
+        src: File to copy
+        dst: Destination path
+        hasher: Empty hash object (e.g. from
+            FileValidator.new_content_hasher) fed every block
+        max_size: Optional limit on the number of bytes copied
+        header_size: Number of leading bytes to return, e.g. for MIME
+            detection
+
+    Returns:
+        Tuple of (hex digest, size in bytes, first header_size bytes)
+
+    Raises:
+        ValidationError: If more than max_size bytes are read, e.g. because
+            the file grew after it was validated
+    """
+    size = 0
+    header = b""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        while block := fsrc.read(COPY_BLOCK_SIZE):
+            if not size:
+                header = block[:header_size]
+            size += len(block)
+            if max_size is not None and size > max_size:
+                raise ValidationError(f"File size exceeds limit of {max_size} bytes")
+            hasher.update(block)
+            fdst.write(block)
+    return hasher.hexdigest(), size, header
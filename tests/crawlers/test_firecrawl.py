@@ -1,6 +1,8 @@
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from src.services.data_ingestion.firecrawl_crawler import SpecCrawler
 import json
+import orjson
 
 @pytest.fixture
 def crawler():
@@ -12,7 +14,7 @@ def crawler():
 @pytest.mark.asyncio
 async def test_get_component_specs(crawler, mocker):
     # Mock Redis
-    mock_redis = mocker.patch.object(crawler, 'redis')
+    mock_redis = mocker.patch.object(crawler, 'redis', new_callable=AsyncMock)
     mock_redis.get.return_value = None
     
     # Mock Firecrawl client
@@ -26,19 +28,113 @@ async def test_get_component_specs(crawler, mocker):
     result = await crawler.get_component_specs('TestMfg', 'TEST-123')
     
     assert result == mock_specs
-    mock_redis.setex.assert_called_once_with(
+    mock_redis.setex.assert_awaited_once_with(
         'specs:TestMfg:TEST-123',
         86400,
-        json.dumps(mock_specs)
+        orjson.dumps(mock_specs)
     )
 
 @pytest.mark.asyncio
 async def test_cache_hit(crawler, mocker):
-    mock_redis = mocker.patch.object(crawler, 'redis')
+    mock_redis = mocker.patch.object(crawler, 'redis', new_callable=AsyncMock)
     cached_specs = {'cached': True}
     mock_redis.get.return_value = json.dumps(cached_specs)
     
     result = await crawler.get_component_specs('TestMfg', 'TEST-123')
     
     assert result == cached_specs
-    mock_redis.setex.assert_not_called() 
\ No newline at end of file
+    mock_redis.setex.assert_not_called() 
+
+@pytest.mark.asyncio
+async def test_batch_crawl_uses_single_mget(crawler, mocker):
+    mock_redis = mocker.patch.object(crawler, 'redis', new_callable=AsyncMock)
+    mock_redis.mget.return_value = [json.dumps({'cached': True}), None]
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__.return_value = pipe
+    
+    mock_client = mocker.patch.object(crawler, 'client')
+    mock_client.crawl_product_specs.return_value = {'model': 'B'}
+    
+    result = await crawler.batch_crawl_specs([
+        {'id': 1, 'manufacturer': 'TestMfg', 'model': 'A'},
+        {'id': 2, 'manufacturer': 'TestMfg', 'model': 'B'},
+        {'id': 3, 'manufacturer': 'TestMfg'},
+    ])
+    
+    assert result == {1: {'cached': True}, 2: {'model': 'B'}}
+    mock_redis.mget.assert_awaited_once_with(
+        ['specs:TestMfg:A', 'specs:TestMfg:B']
+    )
+    mock_redis.get.assert_not_called()
+    mock_client.crawl_product_specs.assert_called_once()
+    pipe.setex.assert_called_once_with(
+        'specs:TestMfg:B', 86400, orjson.dumps({'model': 'B'})
+    )
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_local_cache_skips_redis(crawler, mocker):
+    mock_redis = mocker.patch.object(crawler, 'redis', new_callable=AsyncMock)
+    mock_redis.get.return_value = orjson.dumps({'cached': True})
+    
+    first = await crawler.get_component_specs('TestMfg', 'TEST-123')
+    second = await crawler.get_component_specs('TestMfg', 'TEST-123')
+    
+    assert first == second == {'cached': True}
+    mock_redis.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_crawl_survives_cache_write_failure(crawler, mocker):
+    mock_redis = mocker.patch.object(crawler, 'redis', new_callable=AsyncMock)
+    mock_redis.mget.return_value = [None]
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__.return_value = pipe
+    
+    mock_client = mocker.patch.object(crawler, 'client')
+    mock_client.crawl_product_specs.return_value = {'model': 'A'}
+    
+    result = await crawler.batch_crawl_specs([
+        {'id': 1, 'manufacturer': 'TestMfg', 'model': 'A'},
+    ])
+    
+    assert result == {1: {'model': 'A'}}
+
+
+@pytest.mark.asyncio
+async def test_crawl_awaits_async_client(crawler, mocker):
+    mock_redis = mocker.patch.object(crawler, 'redis', new_callable=AsyncMock)
+    mock_redis.get.return_value = None
+    
+    mock_client = mocker.patch.object(crawler, 'client')
+    mock_client.crawl_product_specs = AsyncMock(return_value={'model': 'A'})
+    
+    result = await crawler.get_component_specs('TestMfg', 'A')
+    
+    assert result == {'model': 'A'}
+    mock_client.crawl_product_specs.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_crawl_survives_cache_read_failure(crawler, mocker):
+    mock_redis = mocker.patch.object(crawler, 'redis', new_callable=AsyncMock)
+    mock_redis.mget.side_effect = ConnectionError("redis down")
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__.return_value = pipe
+    
+    mock_client = mocker.patch.object(crawler, 'client')
+    mock_client.crawl_product_specs.return_value = {'model': 'A'}
+    
+    result = await crawler.batch_crawl_specs([
+        {'id': 1, 'manufacturer': 'TestMfg', 'model': 'A'},
+    ])
+    
+    assert result == {1: {'model': 'A'}}
+    mock_client.crawl_product_specs.assert_called_once()
@@ -0,0 +1,53 @@
+"""Tests for request batching"""
+
+import pytest
+import asyncio
+
+from src.utils.batching import RequestBatcher
+from src.services.exceptions import ServiceError
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_a_batch():
+    batches = []
+
+    async def handler(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = RequestBatcher(handler, max_batch=8, window=0.01)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2, 3, 4]]
+    await batcher.aclose()
+
+@pytest.mark.asyncio
+async def test_handler_error_fails_batch():
+    async def handler(items):
+        raise ValueError("boom")
+
+    batcher = RequestBatcher(handler, max_batch=8, window=0.01)
+    with pytest.raises(ValueError):
+        await batcher.submit(1)
+    await batcher.aclose()
+
+@pytest.mark.asyncio
+async def test_aclose_fails_pending_requests():
+    started = asyncio.Event()
+
+    async def handler(items):
+        started.set()
+        await asyncio.Event().wait()
+
+    batcher = RequestBatcher(handler, max_batch=1, window=0)
+    in_flight = asyncio.create_task(batcher.submit(1))
+    queued = asyncio.create_task(batcher.submit(2))
+    await started.wait()
+
+    await batcher.aclose()
+
+    for task in (in_flight, queued):
+        with pytest.raises(ServiceError):
+            await asyncio.wait_for(task, 1)
+    with pytest.raises(ServiceError):
+        await batcher.submit(3)
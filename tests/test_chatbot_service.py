@@ -120,6 +120,16 @@ async def test_handle_visio_command_invalid_json(chatbot_service, mock_ai_servic
     
     assert "Failed to parse Visio command interpretation" in str(exc_info.value)
 
+@pytest.mark.asyncio
+async def test_handle_visio_command_fenced_json(chatbot_service, mock_ai_service, mock_rag_memory):
+    """Test JSON wrapped in a code fence is unwrapped"""
+    mock_rag_memory.query_memory.return_value = "test context"
+    mock_ai_service.generate_text.return_value = 'Actions:\n```json\n{"action": "test"}\n```'
+    
+    response = await chatbot_service.handle_visio_command("test command")
+    
+    assert response == "Command processed successfully"
+
 @pytest.mark.asyncio
 async def test_conversation_history(chatbot_service, mock_ai_service, mock_rag_memory):
     """Test conversation history management"""
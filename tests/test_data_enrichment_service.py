@@ -1,8 +1,9 @@
 import pytest
+import pytest_asyncio
 from pathlib import Path
 import tempfile
 import aiohttp
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, patch
 import json
 from datetime import datetime
 
@@ -16,14 +17,17 @@ def temp_dir():
     with tempfile.TemporaryDirectory() as temp_dir:
         yield Path(temp_dir)
 
-@pytest.fixture
-def cache_service(temp_dir):
-    return FileCacheService(
+@pytest_asyncio.fixture
+async def cache_service(temp_dir):
+    # Built inside the test's event loop, which starts its cleanup task
+    service = FileCacheService(
         cache_dir=temp_dir / "cache",
         max_cache_size=5 * 1024 * 1024,  # 5MB
         cache_ttl=60,  # 1 minute
         cleanup_interval=5  # 5 seconds
     )
+    yield service
+    await service.close()
 
 @pytest.fixture
 def enrichment_service(cache_service, temp_dir):
@@ -34,10 +38,11 @@ def enrichment_service(cache_service, temp_dir):
     )
 
 class MockResponse:
-    def __init__(self, status, content, content_length=None):
+    def __init__(self, status, content, content_length=None, headers=None):
         self.status = status
         self._content = content
         self.content_length = content_length
+        self.headers = headers or {}
     
     @property
     def content(self):
@@ -45,6 +50,16 @@ class MockResponse:
     
     async def iter_chunked(self, chunk_size):
         yield self._content
+    
+    async def read(self):
+        return self._content
+
+def mock_client_session(response):
+    """Stand-in for aiohttp.ClientSession whose get() yields response"""
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    session.get.return_value.__aenter__.return_value = response
+    return session
 
 @pytest.mark.asyncio
 async def test_download_file_success(enrichment_service, temp_dir):
@@ -53,8 +68,7 @@ async def test_download_file_success(enrichment_service, temp_dir):
     
     # Mock aiohttp response
     mock_response = MockResponse(200, content, len(content))
-    mock_session = Mock()
-    mock_session.get.return_value.__aenter__.return_value = mock_response
+    mock_session = mock_client_session(mock_response)
     
     with patch("aiohttp.ClientSession", return_value=mock_session):
         result = await enrichment_service.download_file(url)
@@ -74,6 +88,50 @@ async def test_download_file_success(enrichment_service, temp_dir):
     with open(cached_path, "rb") as f:
         assert f.read() == content
 
+@pytest.mark.asyncio
+async def test_download_file_commits_to_cache(enrichment_service, cache_service):
+    url = "http://example.com/test.txt"
+    content = b"Test file content"
+    
+    mock_response = MockResponse(200, content, len(content), {"ETag": '"v1"'})
+    mock_session = mock_client_session(mock_response)
+    
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result = await enrichment_service.download_file(url)
+    
+    # The staged download was moved into the cache and registered
+    cached_path = Path(result["file_path"])
+    assert cached_path.parent == cache_service.cache_dir
+    assert not cache_service.reserve_path(enrichment_service._url_key(url)).exists()
+    assert await cache_service.get_cached_url(url) == cached_path
+    
+    cache_info = cache_service.get_cached_metadata(url)
+    assert cache_info["size"] == len(content)
+    assert cache_info["mime_type"] == "text/plain"
+    assert cache_info["etag"] == '"v1"'
+    assert cache_service.metadata["total_size"] == len(content)
+
+@pytest.mark.asyncio
+async def test_download_shares_cache_entry_with_local_file(
+    enrichment_service,
+    cache_service,
+    temp_dir
+):
+    url = "http://example.com/test.txt"
+    content = b"Test file content"
+    
+    mock_session = mock_client_session(MockResponse(200, content, len(content)))
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result = await enrichment_service.download_file(url)
+    
+    # The same bytes cached from a local file land on the same entry
+    local_path = temp_dir / "local.txt"
+    local_path.write_bytes(content)
+    assert await cache_service.get_cached_file(local_path) == Path(result["file_path"])
+    assert await cache_service.cache_file(local_path) == Path(result["file_path"])
+    assert len(cache_service.metadata["files"]) == 1
+    assert cache_service.metadata["total_size"] == len(content)
+
 @pytest.mark.asyncio
 async def test_download_file_from_cache(enrichment_service, temp_dir):
     url = "http://example.com/test.txt"
@@ -81,8 +139,7 @@ async def test_download_file_from_cache(enrichment_service, temp_dir):
     
     # First download to cache
     mock_response = MockResponse(200, content, len(content))
-    mock_session = Mock()
-    mock_session.get.return_value.__aenter__.return_value = mock_response
+    mock_session = mock_client_session(mock_response)
     
     with patch("aiohttp.ClientSession", return_value=mock_session):
         result1 = await enrichment_service.download_file(url)
@@ -95,27 +152,101 @@ async def test_download_file_from_cache(enrichment_service, temp_dir):
     assert result2["from_cache"] is True
     assert result2["file_path"] == result1["file_path"]
 
+@pytest.mark.asyncio
+async def test_download_file_not_modified(enrichment_service, cache_service):
+    url = "http://example.com/test.txt"
+    content = b"Test file content"
+    
+    mock_response = MockResponse(200, content, len(content), {"ETag": '"v1"'})
+    mock_session = mock_client_session(mock_response)
+    
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result1 = await enrichment_service.download_file(url)
+    
+    # Expire the entry so the next call has to revalidate
+    cache_service.cache_ttl = 0
+    
+    mock_session.get.return_value.__aenter__.return_value = MockResponse(304, b"")
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result2 = await enrichment_service.download_file(url)
+    
+    assert mock_session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert result2["from_cache"] is True
+    assert result2["file_path"] == result1["file_path"]
+
+@pytest.mark.asyncio
+async def test_download_file_not_modified_after_cleanup(enrichment_service, cache_service):
+    url = "http://example.com/test.txt"
+    content = b"Test file content"
+    
+    mock_session = mock_client_session(
+        MockResponse(200, content, len(content), {"ETag": '"v1"'})
+    )
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result1 = await enrichment_service.download_file(url)
+    
+    # Expire the entry and let a cleanup pass run before the next download
+    cache_service.cache_ttl = 0
+    await cache_service._cleanup_expired()
+    
+    mock_session.get.return_value.__aenter__.return_value = MockResponse(304, b"")
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result2 = await enrichment_service.download_file(url)
+    
+    # The entry has an ETag, so cleanup kept it for revalidation
+    assert mock_session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert result2["from_cache"] is True
+    assert result2["file_path"] == result1["file_path"]
+
+@pytest.mark.asyncio
+async def test_download_file_not_modified_cache_missing(enrichment_service, cache_service):
+    url = "http://example.com/test.txt"
+    content = b"Test file content"
+    
+    mock_session = mock_client_session(
+        MockResponse(200, content, len(content), {"ETag": '"v1"'})
+    )
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result1 = await enrichment_service.download_file(url)
+    
+    # Expire the entry and lose the cached file behind the metadata's back
+    cache_service.cache_ttl = 0
+    Path(result1["file_path"]).unlink()
+    
+    mock_session.get.return_value.__aenter__.side_effect = [
+        MockResponse(304, b""),
+        MockResponse(200, content, len(content), {"ETag": '"v1"'})
+    ]
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        result2 = await enrichment_service.download_file(url)
+    
+    # Revalidated first, then re-requested without conditional headers
+    first, second = mock_session.get.call_args_list[-2:]
+    assert first.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert "headers" not in second.kwargs
+    assert result2["from_cache"] is False
+    with open(result2["file_path"], "rb") as f:
+        assert f.read() == content
+
 @pytest.mark.asyncio
 async def test_download_large_file(enrichment_service):
     url = "http://example.com/large.txt"
     content = b"0" * (2 * 1024 * 1024)  # 2MB
     
     mock_response = MockResponse(200, content, len(content))
-    mock_session = Mock()
-    mock_session.get.return_value.__aenter__.return_value = mock_response
+    mock_session = mock_client_session(mock_response)
     
     with patch("aiohttp.ClientSession", return_value=mock_session):
         with pytest.raises(ProcessingError) as exc_info:
             await enrichment_service.download_file(url)
-        assert "size exceeds limit" in str(exc_info.value)
+        assert "exceeds limit" in str(exc_info.value)
 
 @pytest.mark.asyncio
 async def test_download_invalid_url(enrichment_service):
     url = "http://example.com/invalid"
     
     mock_response = MockResponse(404, b"Not Found")
-    mock_session = Mock()
-    mock_session.get.return_value.__aenter__.return_value = mock_response
+    mock_session = mock_client_session(mock_response)
     
     with patch("aiohttp.ClientSession", return_value=mock_session):
         with pytest.raises(ProcessingError) as exc_info:
@@ -133,8 +264,7 @@ async def test_enrich_document(enrichment_service, temp_dir):
     url = "http://example.com/data.txt"
     content = b"Enrichment data"
     mock_response = MockResponse(200, content, len(content))
-    mock_session = Mock()
-    mock_session.get.return_value.__aenter__.return_value = mock_response
+    mock_session = mock_client_session(mock_response)
     
     enrichment_data = [
         {
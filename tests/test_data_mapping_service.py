@@ -86,6 +86,23 @@ async def test_load_mapping_examples(mapping_service, sample_examples):
     assert example.target_fields["shape_name"] == "Projector X1000"
     assert example.confidence_score == 0.95
 
+@pytest.mark.asyncio
+async def test_init_preloads_mapping_examples(
+    temp_examples_dir,
+    mock_rag_memory,
+    sample_examples
+):
+    """Test that examples on disk are loaded when the service is built"""
+    service = DataMappingService(
+        rag_memory=mock_rag_memory,
+        examples_dir=temp_examples_dir
+    )
+
+    examples = service.mapping_examples[MappingType.COMPONENT]
+    assert len(examples) == 1
+    assert examples[0].source_data["device"]["name"] == "Projector X1000"
+    assert MappingType.CONNECTION not in service.mapping_examples
+
 @pytest.mark.asyncio
 async def test_save_mapping_examples(mapping_service):
     """Test saving mapping examples to file"""
@@ -250,6 +267,34 @@ def test_create_mapping_prompt(mapping_service):
     assert "Example 1" in prompt
     assert "Test mapping" in prompt
 
+def test_create_mapping_prompt_caches_examples(mapping_service):
+    """Test examples section is cached per mapping type until examples change"""
+    def make_example(explanation):
+        return MappingExample(
+            source_data={"test": "data"},
+            target_fields={"shape": "data"},
+            explanation=explanation,
+            confidence_score=0.9,
+            timestamp=datetime.now()
+        )
+    
+    mapping_service.add_mapping_example(MappingType.LAYOUT, make_example("First"))
+    examples = mapping_service.mapping_examples[MappingType.LAYOUT]
+    
+    prompt = mapping_service._create_mapping_prompt(
+        {"field": "value"}, {}, examples, mapping_type=MappingType.LAYOUT
+    )
+    assert "First" in prompt
+    assert MappingType.LAYOUT in mapping_service._examples_text_cache
+    
+    mapping_service.add_mapping_example(MappingType.LAYOUT, make_example("Second"))
+    assert MappingType.LAYOUT not in mapping_service._examples_text_cache
+    
+    prompt = mapping_service._create_mapping_prompt(
+        {"field": "value"}, {}, examples, mapping_type=MappingType.LAYOUT
+    )
+    assert "Second" in prompt
+
 def test_parse_mapping_response_success(mapping_service):
     """Test successful parsing of mapping response"""
     response = """{
@@ -62,7 +62,7 @@ async def sample_rules(temp_rules_dir):
 @pytest.mark.asyncio
 async def test_load_validation_rules(validation_service, sample_rules):
     """Test loading validation rules from file"""
-    await validation_service.load_validation_rules()
+    await validation_service.reload_validation_rules()
     
     assert DataSource.USER_INPUT.value in validation_service.validation_rules
     rules = validation_service.validation_rules[DataSource.USER_INPUT.value]
@@ -75,6 +75,15 @@ async def test_load_validation_rules(validation_service, sample_rules):
     assert username_rule.max_length == 50
     assert username_rule.regex_pattern == "^[a-zA-Z0-9_]+$"
 
+@pytest.mark.asyncio
+async def test_rules_loaded_on_init(temp_rules_dir, sample_rules):
+    """Test rule files present at construction are loaded immediately"""
+    service = DataValidationService(rules_dir=temp_rules_dir)
+    
+    rules = service.validation_rules[DataSource.USER_INPUT.value]
+    assert len(rules) == 3
+    assert service.validate_data({"age": 25}, DataSource.USER_INPUT)[0].is_valid
+
 @pytest.mark.asyncio
 async def test_save_validation_rules(validation_service):
     """Test saving validation rules to file"""
@@ -144,7 +153,7 @@ async def test_remove_validation_rule(validation_service):
 @pytest.mark.asyncio
 async def test_validate_data(validation_service, sample_rules):
     """Test data validation"""
-    await validation_service.load_validation_rules()
+    await validation_service.reload_validation_rules()
     
     # Test valid data
     valid_data = {
@@ -211,6 +220,9 @@ async def test_validate_types(validation_service):
     result = validation_service._validate_field("int_field", "123", rule)
     assert not result.is_valid
     
+    result = validation_service._validate_field("int_field", True, rule)
+    assert not result.is_valid
+    
     # Date validation
     rule = ValidationRule(
         name="date_field",
@@ -229,6 +241,11 @@ async def test_validate_types(validation_service):
         rule
     )
     assert not result.is_valid
+    
+    assert validation_service._is_valid_date("2024-03-14")
+    assert validation_service._is_valid_date("20240314")
+    assert not validation_service._is_valid_date("2024-13-01")
+    assert not validation_service._is_valid_date("")
 
 @pytest.mark.asyncio
 async def test_custom_validator(validation_service):
@@ -250,6 +267,29 @@ async def test_custom_validator(validation_service):
     assert not result.is_valid
     assert "Number must be even" in result.errors[0]["message"]
 
+@pytest.mark.asyncio
+async def test_custom_validator_memoized(validation_service):
+    """Test registered custom validators run once per distinct value"""
+    calls = []
+    
+    def validate_positive(value):
+        calls.append(value)
+        return value > 0
+    
+    rule = ValidationRule(
+        name="amount",
+        data_type=DataType.FLOAT,
+        custom_validator=validate_positive
+    )
+    validation_service.add_validation_rule(DataSource.API, rule)
+    
+    for _ in range(3):
+        results = validation_service.validate_data({"amount": 5}, DataSource.API)
+        assert results[0].is_valid
+    results = validation_service.validate_data({"amount": -1}, DataSource.API)
+    assert not results[0].is_valid
+    assert calls == [5, -1]
+
 @pytest.mark.asyncio
 async def test_regex_validation(validation_service):
     """Test regex pattern validation"""
@@ -286,4 +326,107 @@ async def test_value_range_validation(validation_service):
     
     result = validation_service._validate_field("score", 101.0, rule)
     assert not result.is_valid
-    assert "at most" in result.errors[0]["message"] 
\ No newline at end of file
+    assert "at most" in result.errors[0]["message"] 
+
+@pytest.mark.asyncio
+async def test_email_and_url_validation(validation_service):
+    """Test email/URL checks, including inputs that used to backtrack"""
+    assert validation_service._is_valid_email("john@example.com")
+    assert not validation_service._is_valid_email("invalid-email")
+    assert not validation_service._is_valid_email("a" * 65 + "@example.com")
+    
+    assert validation_service._is_valid_url("https://www.example.com/path?q=1")
+    assert validation_service._is_valid_url("http://example.com:8080")
+    assert not validation_service._is_valid_url("ftp://example.com")
+    assert not validation_service._is_valid_url("https://exa mple.com")
+    assert not validation_service._is_valid_url("http://" + "a." * 5000 + "!")
+    
+    # IP-literal hosts
+    assert validation_service._is_valid_url("http://192.168.1.1/x")
+    assert validation_service._is_valid_url("https://[2001:db8::1]:8443/x")
+    assert not validation_service._is_valid_url("http://[not-an-ip]/x")
+
+@pytest.mark.asyncio
+async def test_repeated_values_use_cached_checks(validation_service):
+    """Test built-in checks are memoized per (type, value) on the rule"""
+    rule = ValidationRule(
+        name="flag",
+        data_type=DataType.INTEGER,
+        min_value=1
+    )
+    
+    first = validation_service._validate_field("flag", 1, rule)
+    second = validation_service._validate_field("flag", 1, rule)
+    assert first.is_valid and second.is_valid
+    assert len(rule._check_cache) == 1
+    
+    # Equal-but-differently-typed values are checked separately
+    result = validation_service._validate_field("flag", 1.0, rule)
+    assert not result.is_valid
+    assert len(rule._check_cache) == 2
+    
+    # Unhashable values bypass the cache
+    list_rule = ValidationRule(name="items", data_type=DataType.LIST)
+    assert validation_service._validate_field("items", [1], list_rule).is_valid
+    assert len(list_rule._check_cache) == 0
+
+@pytest.mark.asyncio
+async def test_validate_batch_matches_validate_data(validation_service, sample_rules):
+    """Test batch validation gives the same results as per-record validation"""
+    await validation_service.reload_validation_rules()
+    validation_service.add_validation_rule(
+        DataSource.USER_INPUT,
+        ValidationRule(name="tier", data_type=DataType.INTEGER, allowed_values=[1, 2])
+    )
+    
+    records = [
+        {"username": "john_doe", "age": 25, "email": "john@example.com", "tier": 1},
+        {"username": "j", "age": 200, "email": "invalid-email", "tier": 3},
+        {"age": "25", "tier": 2.5},
+        {"age": -1, "username": "jane_doe"},
+    ]
+    
+    batch = validation_service.validate_batch(records, DataSource.USER_INPUT)
+    assert len(batch) == len(records)
+    
+    def summary(results):
+        return [(r.field_name, r.is_valid, r.errors) for r in results]
+    
+    for record, results in zip(records, batch):
+        expected = validation_service.validate_data(record, DataSource.USER_INPUT)
+        assert summary(results) == summary(expected)
+    
+    # Failures only
+    batch = validation_service.validate_batch(
+        records, DataSource.USER_INPUT, include_valid=False
+    )
+    assert batch[0] == []
+    for record, results in zip(records, batch):
+        expected = validation_service.validate_data(
+            record, DataSource.USER_INPUT, include_valid=False
+        )
+        assert all(not r.is_valid for r in expected)
+        assert summary(results) == summary(expected)
+
+@pytest.mark.asyncio
+async def test_validate_batch_large_integers(validation_service):
+    """Ints too large for float64 fall back to per-row checks"""
+    validation_service.add_validation_rule(
+        DataSource.USER_INPUT,
+        ValidationRule(
+            name="count",
+            data_type=DataType.INTEGER,
+            max_value=2 ** 53
+        )
+    )
+    
+    records = [{"count": 10 ** 400}, {"count": 2 ** 53 + 1}, {"count": 2 ** 53}]
+    batch = validation_service.validate_batch(records, DataSource.USER_INPUT)
+    
+    def summary(results):
+        return [(r.field_name, r.is_valid, r.errors) for r in results]
+    
+    for record, results in zip(records, batch):
+        expected = validation_service.validate_data(record, DataSource.USER_INPUT)
+        assert summary(results) == summary(expected)
+    assert [results[0].is_valid for results in batch] == [False, False, True]
@@ -6,6 +6,7 @@ import pytest
 import asyncio
 from typing import Dict, Any
 from src.services.deep_validator import DeepValidator
+from src.services import deep_validator
 from src.models.validation_models import (
     ValidationResult,
     ValidationSeverity,
@@ -196,6 +197,36 @@ async def test_validate_diagram_failure():
     assert result.score < 50
     assert len(result.issues) > 0
 
+@pytest.mark.asyncio
+async def test_validate_diagram_cached_result(sample_diagram_data, tmp_path):
+    """Test diagram results are stored as JSON and read back by a new validator"""
+    result = await DeepValidator({'cache_dir': tmp_path}).validate_diagram(sample_diagram_data)
+    assert isinstance(result, deep_validator.ValidationResult)
+    assert result.score > 0
+    assert len(result.issues) == (
+        len(result.color_results.issues)
+        + len(result.text_results.issues)
+        + len(result.spacing_result.issues)
+    )
+    
+    cached_files = list(tmp_path.glob('*.json'))
+    assert len(cached_files) == 1
+    
+    cached = await DeepValidator({'cache_dir': tmp_path}).validate_diagram(sample_diagram_data)
+    assert cached == result
+    assert isinstance(cached.spacing_result, deep_validator.SpacingResult)
+
+@pytest.mark.asyncio
+async def test_validate_diagram_starts_gc_task(validator, sample_diagram_data):
+    """Test validating a diagram starts the background GC task"""
+    await validator.validate_diagram(sample_diagram_data)
+
+    gc_task = validator.resource_manager._gc_task
+    assert gc_task is not None
+    assert not gc_task.done()
+
+    await validator.resource_manager.aclose()
+
 @pytest.mark.asyncio
 async def test_validation_error_handling():
     """Test error handling in validation"""
@@ -229,6 +260,18 @@ def test_contrast_calculation():
     assert validator._calculate_contrast(black, white) > 20  # High contrast
     assert validator._calculate_contrast(gray, gray) == 0   # No contrast
 
+def test_suggest_accessible_color():
+    """Test accessible color suggestion for a low-contrast pair"""
+    validator = DeepValidator()
+    
+    fg = (119, 119, 119)
+    bg = (136, 136, 136)
+    suggestion = validator._suggest_accessible_color(fg, bg, target=4.5)
+    
+    assert suggestion is not None
+    suggested = validator._parse_color(suggestion)
+    assert validator._calculate_contrast(suggested, bg) >= 4.5
+
 def test_readability_calculation():
     """Test text readability scoring"""
     validator = DeepValidator()
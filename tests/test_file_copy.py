@@ -0,0 +1,36 @@
+"""Tests for single-pass file copying"""
+
+import hashlib
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.services.exceptions import ValidationError
+from src.utils.file_copy import copy_and_hash
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+def test_copy_and_hash(temp_dir):
+    src = temp_dir / "src.txt"
+    dst = temp_dir / "dst.txt"
+    content = b"Test content"
+    src.write_bytes(content)
+
+    digest, size, header = copy_and_hash(src, dst, hashlib.sha256(), header_size=4)
+
+    assert dst.read_bytes() == content
+    assert digest == hashlib.sha256(content).hexdigest()
+    assert size == len(content)
+    assert header == b"Test"
+
+def test_copy_and_hash_max_size(temp_dir):
+    src = temp_dir / "src.txt"
+    src.write_bytes(b"0" * 100)
+
+    with pytest.raises(ValidationError) as exc_info:
+        copy_and_hash(src, temp_dir / "dst.txt", hashlib.sha256(), max_size=10)
+    assert "exceeds limit" in str(exc_info.value)
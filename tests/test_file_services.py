@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 from pathlib import Path
 import tempfile
 import shutil
@@ -20,14 +21,17 @@ def temp_dir():
 def validator():
     return FileValidator(max_file_size=1024 * 1024)  # 1MB
 
-@pytest.fixture
-def cache_service(temp_dir):
-    return FileCacheService(
+@pytest_asyncio.fixture
+async def cache_service(temp_dir):
+    # Built inside the test's event loop, which starts its cleanup task
+    service = FileCacheService(
         cache_dir=temp_dir / "cache",
         max_cache_size=5 * 1024 * 1024,  # 5MB
         cache_ttl=60,  # 1 minute
         cleanup_interval=5  # 5 seconds
     )
+    yield service
+    await service.close()
 
 def create_test_file(path: Path, content: bytes) -> None:
     """Create a test file with specific content"""
@@ -79,6 +83,31 @@ def test_validate_with_allowed_categories(validator, temp_dir):
         )
     assert "not allowed" in str(exc_info.value)
 
+def test_validate_with_precomputed_hash(validator, temp_dir):
+    file_path = temp_dir / "test.txt"
+    create_test_file(file_path, b"Test content")
+    precomputed = "a" * 64
+    
+    result = validator.validate_file(
+        file_path,
+        precomputed_hash=precomputed,
+        precomputed_size=12
+    )
+    assert result.hash == precomputed
+    assert result.size == 12
+
+def test_validate_cached_until_file_changes(validator, temp_dir):
+    file_path = temp_dir / "test.txt"
+    create_test_file(file_path, b"Test content")
+    
+    first = validator.validate_file(file_path)
+    assert validator.validate_file(file_path) is first
+    
+    create_test_file(file_path, b"Changed content")
+    second = validator.validate_file(file_path)
+    assert second is not first
+    assert second.hash != first.hash
+
 # File Cache Tests
 @pytest.mark.asyncio
 async def test_cache_and_retrieve_file(cache_service, temp_dir):
@@ -101,6 +130,22 @@ async def test_cache_and_retrieve_file(cache_service, temp_dir):
     with open(retrieved_path, "rb") as f:
         assert f.read() == content
 
+@pytest.mark.asyncio
+async def test_cache_and_retrieve_by_url(cache_service, temp_dir):
+    file_path = temp_dir / "test.txt"
+    create_test_file(file_path, b"Test content")
+    url = "http://example.com/test.txt"
+    
+    assert await cache_service.get_cached_url(url) is None
+    
+    cached_path = await cache_service.cache_file(file_path, source_url=url)
+    assert cached_path is not None
+    
+    # Lookup by URL does not need the original file
+    file_path.unlink()
+    retrieved_path = await cache_service.get_cached_url(url)
+    assert retrieved_path == cached_path
+
 @pytest.mark.asyncio
 async def test_cache_expiration(cache_service, temp_dir):
     # Create test file
@@ -124,7 +169,8 @@ async def test_cache_size_limit(cache_service, temp_dir):
     files = []
     for i in range(3):
         file_path = temp_dir / f"test{i}.txt"
-        create_test_file(file_path, b"0" * (2 * 1024 * 1024))  # 2MB each
+        # Distinct content, since the cache stores identical files once
+        create_test_file(file_path, str(i).encode() * (2 * 1024 * 1024))  # 2MB each
         files.append(file_path)
     
     # Cache files (should exceed cache size)
@@ -157,6 +203,9 @@ async def test_cache_metadata_persistence(cache_service, temp_dir):
 
 @pytest.mark.asyncio
 async def test_cache_cleanup(cache_service, temp_dir):
+    # Expire files well before the next cleanup pass
+    cache_service.cache_ttl = 1
+    
     # Create test files
     files = []
     for i in range(2):
@@ -171,6 +220,10 @@ async def test_cache_cleanup(cache_service, temp_dir):
     # Wait for cleanup
     await asyncio.sleep(cache_service.cleanup_interval + 1)
     
-    # Verify cache directory is empty
-    cache_files = list(cache_service.cache_dir.glob("*"))
-    assert len(cache_files) <= 1  # Only metadata file should remain 
\ No newline at end of file
+    # Verify only the metadata snapshot and access journal remain
+    metadata_files = {cache_service.metadata_file, cache_service.journal_file}
+    cache_files = [
+        path for path in cache_service.cache_dir.glob("*")
+        if path not in metadata_files
+    ]
+    assert cache_files == []
@@ -40,7 +40,8 @@ def test_shape_data_preparation(tmp_path):
     
     assert (tmp_path / "metadata.json").exists()
     
-def test_diagram_generation_with_classification():
+@pytest.mark.asyncio
+async def test_diagram_generation_with_classification():
     """Test diagram generation with shape classification"""
     classifier = ShapeClassifierService("models/shape_classifier.pth")
     generator = DiagramGenerationService(classifier)
@@ -53,6 +54,6 @@ def test_diagram_generation_with_classification():
         }
     ]
     
-    diagram = generator.generate_diagram(components)
+    diagram = await generator.generate_diagram(components)
     assert len(diagram.shapes) == 1
     assert diagram.shapes[0].type == "display" 
\ No newline at end of file